@@ -1,154 +1,318 @@
+import asyncio
+from collections.abc import Iterator
 import logging
 import re
+import time
 from typing import Any
 
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from pydantic import ValidationError
 
 from app.core.errors import ExtractionError
 from app.core.schemas import ContractExtraction, DocumentText
 from app.processing.data_cleaner import clean_payload_for_model
-from app.services.structured_llm import run_structured_llm
+from app.processing.regex_utils import compile_linear_pattern
+from app.services.extraction_cache import ExtractionCache, ExtractionCacheKey
+from app.services.structured_llm import arun_structured_llm, run_structured_llm
+
+try:
+    import ahocorasick
+except ModuleNotFoundError:  # pragma: no cover - depends on runtime environment
+    ahocorasick = None
+
+# Bump whenever the extraction prompt or normalization changes so cached
+# results produced by the previous prompt are no longer reused.
+PROMPT_VERSION = "v1"
+LLM_PROVIDER = "anthropic"
+
+_SYSTEM_PROMPT = (
+    "You extract contract fields and return STRICT JSON only with these keys: "
+    "vendor_name, contract_start_date, contract_end_date, total_value. "
+    "Do not add extra keys. Return JSON only with no prose or markdown."
+)
+# The system prompt is identical on every request, so it is marked as a cache
+# breakpoint; Anthropic serves it from the prompt cache once the prefix is long
+# enough to qualify and simply ignores the marker otherwise.
+_SYSTEM_CONTENT = (
+    {"type": "text", "text": _SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+)
+_USER_PROMPT_PREFIX = "Extract fields from this contract text and return strict JSON only:\n\n"
+_MODEL_NOT_FOUND_MESSAGE = (
+    "Configured EXTRACTION_MODEL is not available for this Anthropic API key. "
+    "Set EXTRACTION_MODEL to a model id available in your Anthropic account."
+)
+
+_SECTION_SPLIT_RE = compile_linear_pattern(r"\n\s*\n")
+_HEAD_MARKER = "\n\n[...TRUNCATED FOR TOKEN LIMIT...]\n\n"
+_TAIL_MARKER = "\n\n[...END TRUNCATED SECTION...]\n\n"
+_MARKER_RESERVE_CHARS = 128
+
+_KEYWORDS = (
+    "vendor",
+    "supplier",
+    "agreement",
+    "contract",
+    "effective",
+    "start",
+    "end",
+    "term",
+    "expires",
+    "amount",
+    "value",
+    "total",
+    "usd",
+    "$",
+)
+
+
+def _build_keyword_automaton() -> Any:
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _KEYWORDS:
+        automaton.add_word(keyword, len(keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    # Same semantics as regex `\b`, so automaton hits match `_KEYWORD_PATTERN`.
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
 
 
 class ExtractionAgent:
+    # Stdlib `re` on purpose: RE2's `\b` is ASCII-only, so "äend" would match
+    # "end". A plain alternation does not backtrack badly anyway.
     _KEYWORD_PATTERN = re.compile(
-        r"(?i)\b(vendor|supplier|agreement|contract|effective|start|end|term|expires|amount|value|total|usd|\$)\b"
+        r"(?i)\b(" + "|".join(re.escape(keyword) for keyword in _KEYWORDS) + r")\b"
     )
 
-    def __init__(self, llm: BaseChatModel, max_retries: int, max_input_chars: int = 24000):
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        max_retries: int,
+        max_input_chars: int = 24000,
+        cache: ExtractionCache | None = None,
+    ):
         self._logger = logging.getLogger(__name__)
         self._max_retries = max_retries
         self._llm = llm
         self._max_input_chars = max(max_input_chars, 4000)
+        self._cache = cache
 
     def extract(self, document: DocumentText) -> tuple[ContractExtraction, dict[str, Any], int]:
+        start = time.perf_counter()
         bounded_text = self._build_bounded_input_text(document.raw_text)
-        system_prompt = (
-            "You extract contract fields and return STRICT JSON only with these keys: "
-            "vendor_name, contract_start_date, contract_end_date, total_value. "
-            "Do not add extra keys. Return JSON only with no prose or markdown."
+
+        cache_key = self._cache_key(bounded_text)
+        if cache_key is not None:
+            cached = self._load_cached(cache_key)
+            if cached is not None:
+                latency_ms = int((time.perf_counter() - start) * 1000)
+                return cached, {"cache_hit": True}, latency_ms
+
+        result = run_structured_llm(
+            self._llm,
+            self._build_messages(bounded_text),
+            **self._structured_llm_options(),
         )
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(
-                content=(
-                    "Extract fields from this contract text and return strict JSON only:\n\n"
-                    f"{bounded_text}"
-                )
-            ),
-        ]
 
-        def _parse_output(parsed: dict[str, Any]) -> ContractExtraction:
-            cleaned = clean_payload_for_model(parsed, ContractExtraction)
-            normalized = self._normalize_payload(cleaned)
-            return ContractExtraction.model_validate(normalized)
+        self._store_cached(cache_key, result[0])
+        return result
+
+    async def aextract(self, document: DocumentText) -> tuple[ContractExtraction, dict[str, Any], int]:
+        """`extract` for async callers; cache I/O runs in a worker thread."""
+        start = time.perf_counter()
+        bounded_text = self._build_bounded_input_text(document.raw_text)
+
+        cache_key = self._cache_key(bounded_text)
+        if cache_key is not None:
+            cached = await asyncio.to_thread(self._load_cached, cache_key)
+            if cached is not None:
+                latency_ms = int((time.perf_counter() - start) * 1000)
+                return cached, {"cache_hit": True}, latency_ms
 
-        return run_structured_llm(
+        result = await arun_structured_llm(
             self._llm,
-            messages,
-            max_retries=self._max_retries,
-            parse_output=_parse_output,
-            logger=self._logger,
-            parse_failure_event="extraction_parse_failure",
-            parse_failure_log_message="Extraction parse failure",
-            not_found_message=(
-                "Configured EXTRACTION_MODEL is not available for this Anthropic API key. "
-                "Set EXTRACTION_MODEL to a model id available in your Anthropic account."
-            ),
-            error_type=ExtractionError,
-            final_error_prefix="Extraction failed",
+            self._build_messages(bounded_text),
+            **self._structured_llm_options(),
         )
 
+        if cache_key is not None:
+            await asyncio.to_thread(self._store_cached, cache_key, result[0])
+        return result
+
     @staticmethod
-    def _normalize_payload(payload: Any) -> dict[str, Any]:
-        if not isinstance(payload, dict):
-            raise ValueError("Extraction payload is not a JSON object")
-
-        normalized = dict(payload)
-
-        normalized.setdefault("vendor_name", "")
-        normalized.setdefault("contract_start_date", "")
-        normalized.setdefault("contract_end_date", "")
-        normalized.setdefault("total_value", 0)
-
-        for field in (
-            "vendor_name",
-            "contract_start_date",
-            "contract_end_date",
-        ):
-            value = normalized.get(field)
-            if value is None:
-                normalized[field] = ""
-
-        total_value = normalized.get("total_value")
-        if total_value is None or total_value == "":
-            normalized["total_value"] = 0.0
-
-        # Derive confidence deterministically from completeness of essential fields.
-        completeness = 0
-        if normalized["vendor_name"]:
-            completeness += 1
-        if normalized["contract_start_date"]:
-            completeness += 1
-        if normalized["contract_end_date"]:
-            completeness += 1
-        if isinstance(normalized["total_value"], (int, float)) and normalized["total_value"] > 0:
-            completeness += 1
-        normalized["confidence_score"] = round(completeness / 4, 2)
-
-        return normalized
+    def _build_messages(bounded_text: str) -> list[BaseMessage]:
+        return [
+            SystemMessage(content=list(_SYSTEM_CONTENT)),
+            HumanMessage(content=_USER_PROMPT_PREFIX + bounded_text),
+        ]
+
+    def _structured_llm_options(self) -> dict[str, Any]:
+        return {
+            "max_retries": self._max_retries,
+            "parse_output": self._parse_output,
+            "logger": self._logger,
+            "parse_failure_event": "extraction_parse_failure",
+            "parse_failure_log_message": "Extraction parse failure",
+            "not_found_message": _MODEL_NOT_FOUND_MESSAGE,
+            "error_type": ExtractionError,
+            "final_error_prefix": "Extraction failed",
+        }
+
+    @staticmethod
+    def _parse_output(parsed: dict[str, Any]) -> ContractExtraction:
+        cleaned = clean_payload_for_model(parsed, ContractExtraction)
+        # Confidence is always derived from completeness, never taken from the model.
+        cleaned.pop("confidence_score", None)
+        return ContractExtraction.model_validate(cleaned)
+
+    def _model_name(self) -> str:
+        return str(getattr(self._llm, "model", "") or "")
+
+    def _cache_key(self, bounded_text: str) -> ExtractionCacheKey | None:
+        if self._cache is None:
+            return None
+        return ExtractionCacheKey.for_text(
+            provider=LLM_PROVIDER,
+            model=self._model_name(),
+            prompt_version=PROMPT_VERSION,
+            text=bounded_text,
+        )
+
+    def _store_cached(self, key: ExtractionCacheKey | None, extraction: ContractExtraction) -> None:
+        if self._cache is not None and key is not None:
+            self._cache.put(key, extraction.model_dump(mode="json"))
+
+    def _load_cached(self, key: ExtractionCacheKey) -> ContractExtraction | None:
+        payload = self._cache.get(key) if self._cache is not None else None
+        if payload is None:
+            return None
+
+        try:
+            extraction = ContractExtraction.model_validate(payload)
+        except ValidationError as exc:
+            self._logger.warning(
+                "Discarding invalid cached extraction",
+                extra={"event": "extraction_cache_invalid", "error": str(exc)},
+            )
+            return None
+
+        self._logger.info(
+            "Extraction served from cache",
+            extra={"event": "extraction_cache_hit", "prompt_version": key.prompt_version},
+        )
+        return extraction
 
     def _build_bounded_input_text(self, text: str) -> str:
+        max_chars = self._max_input_chars
+        # Common case: already-normalized short text needs no strip/copy.
+        if len(text) <= max_chars and not text[:1].isspace() and not text[-1:].isspace():
+            return text
+
         normalized = text.strip()
-        if len(normalized) <= self._max_input_chars:
+        original_chars = len(normalized)
+        if original_chars <= max_chars:
             return normalized
 
-        head_budget = int(self._max_input_chars * 0.35)
-        tail_budget = int(self._max_input_chars * 0.2)
-        middle_budget = self._max_input_chars - head_budget - tail_budget - 128
-        middle_budget = max(middle_budget, int(self._max_input_chars * 0.2))
+        head_budget = int(max_chars * 0.35)
+        tail_budget = int(max_chars * 0.2)
+        # The keyword middle never exceeds its budget, so the final slice only
+        # trims if the markers or budgets drift (a full-length slice is free).
+        middle_budget = max_chars - head_budget - tail_budget - _MARKER_RESERVE_CHARS
 
         keyword_middle = self._select_keyword_sections(normalized, middle_budget)
-        bounded = (
-            f"{normalized[:head_budget]}\n\n"
-            "[...TRUNCATED FOR TOKEN LIMIT...]\n\n"
-            f"{keyword_middle}\n\n"
-            "[...END TRUNCATED SECTION...]\n\n"
-            f"{normalized[-tail_budget:]}"
-        )
-
-        if len(bounded) > self._max_input_chars:
-            bounded = bounded[: self._max_input_chars]
+        bounded = "".join(
+            (
+                normalized[:head_budget],
+                _HEAD_MARKER,
+                keyword_middle,
+                _TAIL_MARKER,
+                normalized[original_chars - tail_budget :],
+            )
+        )[:max_chars]
 
         self._logger.warning(
             "Contract text truncated before extraction",
             extra={
                 "event": "extraction_input_truncated",
-                "original_chars": len(normalized),
+                "original_chars": original_chars,
                 "bounded_chars": len(bounded),
-                "max_input_chars": self._max_input_chars,
+                "max_input_chars": max_chars,
             },
         )
         return bounded
 
     def _select_keyword_sections(self, text: str, budget: int) -> str:
-        sections = re.split(r"\n\s*\n", text)
-        chosen: list[str] = []
-        used = 0
+        candidates: list[tuple[float, int, str]] = []
+        for start, end, hit_count in self._iter_keyword_sections(text):
+            chunk = text[start:end].strip()[:1200]
+            if chunk:
+                candidates.append((hit_count / len(chunk), start, chunk))
 
-        for section in sections:
-            chunk = section.strip()
-            if not chunk or not self._KEYWORD_PATTERN.search(chunk):
-                continue
-            chunk = chunk[:1200]
-            if used + len(chunk) + 2 > budget:
+        # Pack the most keyword-dense sections first, then restore document order.
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        chosen: list[tuple[int, str]] = []
+        used = 0
+        for _, start, chunk in candidates:
+            if used + 3 > budget:
                 break
-            chosen.append(chunk)
+            if used + len(chunk) + 2 > budget:
+                continue
+            chosen.append((start, chunk))
             used += len(chunk) + 2
 
         if chosen:
-            return "\n\n".join(chosen)
+            chosen.sort()
+            return "\n\n".join(chunk for _, chunk in chosen)
 
         mid_start = max((len(text) // 2) - (budget // 2), 0)
         return text[mid_start : mid_start + budget]
+
+    @staticmethod
+    def _iter_section_spans(text: str) -> Iterator[tuple[int, int]]:
+        start = 0
+        for separator in _SECTION_SPLIT_RE.finditer(text):
+            yield start, separator.start()
+            start = separator.end()
+        yield start, len(text)
+
+    def _iter_keyword_sections(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """Yield `(start, end, hit_count)` for each section containing a keyword."""
+        lowered = text.lower()
+        # Offsets are only reusable when lowercasing keeps the string length.
+        if _KEYWORD_AUTOMATON is None or len(lowered) != len(text):
+            for start, end in self._iter_section_spans(text):
+                hit_count = sum(1 for _ in self._KEYWORD_PATTERN.finditer(text, start, end))
+                if hit_count:
+                    yield start, end, hit_count
+            return
+
+        # Whole-word hits never overlap, so their start offsets arrive in
+        # increasing order and can be merged against the section spans.
+        spans = self._iter_section_spans(text)
+        span_start, span_end = next(spans)
+        hit_count = 0
+        for last_index, length in _KEYWORD_AUTOMATON.iter(lowered):
+            hit_start = last_index - length + 1
+            if not (_is_word_boundary(lowered, hit_start) and _is_word_boundary(lowered, last_index + 1)):
+                continue
+            while hit_start >= span_end:
+                if hit_count:
+                    yield span_start, span_end, hit_count
+                    hit_count = 0
+                span_start, span_end = next(spans)
+            hit_count += 1
+        if hit_count:
+            yield span_start, span_end, hit_count
@@ -1,5 +1,6 @@
+from collections.abc import Iterator
 import logging
-import re
+from operator import attrgetter
 import time
 from typing import Any
 
@@ -7,6 +8,18 @@ from langchain_core.language_models.chat_models import BaseChatModel
 
 from app.core.config import get_settings
 from app.core.schemas import ContractExtraction, RetrievedPolicy, ValidationResult
+from app.processing.regex_utils import compile_linear_pattern
+
+# RE2 is linear-time by construction; the stdlib fallback uses possessive
+# quantifiers (Python 3.11+) to get the same guarantee on long digit runs.
+_POLICY_THRESHOLD_RE = compile_linear_pattern(
+    r"(?i)(?:usd|\$)\s*([0-9][0-9,]*(?:\.[0-9]+)?)",
+    stdlib_pattern=r"(?i)(?:usd|\$)\s*+([0-9][0-9,]*+(?:\.[0-9]++)?)",
+)
+_COMMA_STRIP = str.maketrans("", "", ",")
+_REQUIRED_FIELDS = tuple(
+    (name, attrgetter(name)) for name in ("vendor_name", "contract_start_date", "contract_end_date")
+)
 
 
 class ValidationAgent:
@@ -19,11 +32,15 @@ class ValidationAgent:
         self._policy_threshold = get_settings().policy_threshold
 
     def validate(
-        self, contract: ContractExtraction, policies: list[RetrievedPolicy]
+        self,
+        contract: ContractExtraction,
+        policies: list[RetrievedPolicy],
+        missing_fields: list[str] | None = None,
     ) -> tuple[ValidationResult, dict[str, Any], int]:
         start = time.perf_counter()
         threshold = self._extract_policy_threshold(policies) or self._policy_threshold
-        missing_fields = self._missing_required_fields(contract)
+        if missing_fields is None:
+            missing_fields = self._missing_required_fields(contract)
         exceeds_threshold = contract.total_value > threshold
 
         policy_violations: list[str] = []
@@ -51,34 +68,25 @@ class ValidationAgent:
         latency_ms = int((time.perf_counter() - start) * 1000)
         return result, {"mode": "deterministic", "llm_configured": self._llm is not None}, latency_ms
 
+    def missing_required_fields(self, contract: ContractExtraction) -> list[str]:
+        """Policy-independent checks, computable before policies are retrieved."""
+        return self._missing_required_fields(contract)
+
     @staticmethod
     def _missing_required_fields(contract: ContractExtraction) -> list[str]:
-        missing: list[str] = []
-
-        if not contract.vendor_name.strip():
-            missing.append("vendor_name")
-        if not contract.contract_start_date.strip():
-            missing.append("contract_start_date")
-        if not contract.contract_end_date.strip():
-            missing.append("contract_end_date")
-
-        return missing
+        return [name for name, getter in _REQUIRED_FIELDS if not getter(contract).strip()]
 
     @staticmethod
     def _extract_policy_threshold(policies: list[RetrievedPolicy]) -> float | None:
-        pattern = re.compile(r"(?i)(?:usd|\$)\s*([0-9][0-9,]*(?:\.[0-9]+)?)")
-        candidates: list[float] = []
+        return min(_iter_policy_amounts(policies), default=None)
 
-        for policy in policies:
-            for match in pattern.finditer(policy.content):
-                value = match.group(1).replace(",", "")
-                try:
-                    parsed = float(value)
-                    if parsed > 0:
-                        candidates.append(parsed)
-                except ValueError:
-                    continue
 
-        if not candidates:
-            return None
-        return min(candidates)
+def _iter_policy_amounts(policies: list[RetrievedPolicy]) -> Iterator[float]:
+    for policy in policies:
+        for match in _POLICY_THRESHOLD_RE.finditer(policy.content):
+            try:
+                parsed = float(match.group(1).translate(_COMMA_STRIP))
+            except ValueError:
+                continue
+            if parsed > 0:
+                yield parsed
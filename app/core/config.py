@@ -1,5 +1,6 @@
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -31,20 +32,33 @@ class Settings(BaseSettings):
     extraction_max_retries: int = 3
     validation_max_retries: int = 3
     extraction_max_input_chars: int = Field(default=24000, alias="EXTRACTION_MAX_INPUT_CHARS")
+    extraction_cache_enabled: bool = Field(default=True, alias="EXTRACTION_CACHE_ENABLED")
+    extraction_cache_ttl_seconds: int = Field(default=604800, alias="EXTRACTION_CACHE_TTL_SECONDS")
 
     max_upload_size_bytes: int = Field(default=10485760, alias="MAX_UPLOAD_SIZE_BYTES")
     webhook_sync_timeout_seconds: int = Field(default=30, alias="WEBHOOK_SYNC_TIMEOUT_SECONDS")
     pipeline_workers: int = Field(default=4, alias="PIPELINE_WORKERS")
     webhook_idempotency_enabled: bool = Field(default=True, alias="WEBHOOK_IDEMPOTENCY_ENABLED")
+    # "database" shares idempotency claims across uvicorn worker processes.
+    webhook_idempotency_store: Literal["memory", "database"] = Field(
+        default="memory", alias="WEBHOOK_IDEMPOTENCY_STORE"
+    )
+    # Unset values are derived from PIPELINE_WORKERS in app/db/session.py.
+    db_pool_size: int | None = Field(default=None, ge=1, alias="DB_POOL_SIZE")
+    db_max_overflow: int | None = Field(default=None, ge=0, alias="DB_MAX_OVERFLOW")
 
     embedding_device: str = "cpu"
     embedding_cache_dir: Path = Path("./.cache/huggingface")
     embedding_local_files_only: bool = False
+    embedding_batch_size: int = 64
+    # "onnx" runs the encoder through ONNX Runtime (needs optimum[onnxruntime]);
+    # the default file is the int8 AVX-512 VNNI export shipped with MiniLM.
+    embedding_backend: Literal["torch", "onnx"] = "torch"
+    embedding_onnx_file: str = "onnx/model_qint8_avx512_vnni.onnx"
 
     chroma_persist_dir: Path = Path("./chroma_db")
     chroma_collection: str = "vendor_contract_policies"
     policy_dir: Path = Path("./data/policies")
-    upload_dir: Path = Path("./tmp_uploads")
 
     retrieval_k: int = 4
     policy_threshold: float = Field(default=500000.0, alias="POLICY_THRESHOLD")
@@ -56,33 +70,37 @@ class Settings(BaseSettings):
         populate_by_name=True,
     )
 
-    @property
+    @cached_property
     def resolved_database_url(self) -> str:
         return self.database_url.strip()
 
-    @property
+    @cached_property
     def resolved_llm_api_key(self) -> str:
         if self.llm_api_key.strip():
             return self.llm_api_key.strip()
         return self.anthropic_api_key.strip()
 
-    @property
+    @cached_property
+    def resolved_webhook_secret(self) -> str:
+        return self.webhook_secret.strip()
+
+    @cached_property
     def resolved_admin_api_key(self) -> str:
         return self.admin_api_key.strip()
 
-    @property
+    @cached_property
     def resolved_extraction_model(self) -> str:
         if self.extraction_model.strip():
             return self.extraction_model.strip()
         return self.llm_model.strip()
 
-    @property
+    @cached_property
     def resolved_validation_model(self) -> str:
         if self.validation_model.strip():
             return self.validation_model.strip()
         return self.resolved_extraction_model
 
-    @property
+    @cached_property
     def allowed_origins(self) -> list[str]:
         return [
             origin.strip()
@@ -91,23 +109,16 @@ class Settings(BaseSettings):
         ]
 
     def missing_required_env_vars(self) -> list[str]:
-        missing: list[str] = []
-
-        checks = {
-            "ANTHROPIC_API_KEY": self.anthropic_api_key,
-            "DATABASE_URL": self.database_url,
-            "WEBHOOK_SECRET": self.webhook_secret,
-            "ALLOWED_ORIGINS": self.allowed_origins_raw,
-            "EXTRACTION_MODEL": self.resolved_extraction_model,
-            "VALIDATION_MODEL": self.resolved_validation_model,
-            "EMBEDDING_MODEL": self.embedding_model,
-        }
-
-        for key, value in checks.items():
-            if not str(value).strip():
-                missing.append(key)
-
-        return missing
+        checks = (
+            ("ANTHROPIC_API_KEY", self.anthropic_api_key.strip()),
+            ("DATABASE_URL", self.resolved_database_url),
+            ("WEBHOOK_SECRET", self.resolved_webhook_secret),
+            ("ALLOWED_ORIGINS", self.allowed_origins_raw.strip()),
+            ("EXTRACTION_MODEL", self.resolved_extraction_model),
+            ("VALIDATION_MODEL", self.resolved_validation_model),
+            ("EMBEDDING_MODEL", self.embedding_model.strip()),
+        )
+        return [key for key, value in checks if not value]
 
     def weak_required_env_vars(self) -> list[str]:
         weak: set[str] = set()
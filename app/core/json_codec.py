@@ -0,0 +1,40 @@
+"""JSON encode/decode helpers backed by orjson when available."""
+from __future__ import annotations
+
+from datetime import date
+import json
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - depends on runtime environment
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib type regardless of which backend is active.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def _default(value: Any) -> str:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Encode straight to UTF-8 bytes, rendering dates/datetimes as ISO strings."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, default=_default, separators=(",", ":")).encode("utf-8")
@@ -1,7 +1,9 @@
 from datetime import datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+_REQUIRED_STRING_FIELDS = ("vendor_name", "contract_start_date", "contract_end_date")
 
 
 class DocumentMetadata(BaseModel):
@@ -10,14 +12,14 @@ class DocumentMetadata(BaseModel):
     filename: str
     received_at: datetime
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class DocumentText(BaseModel):
     raw_text: str = Field(min_length=1)
     metadata: dict[str, Any]
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class ContractExtraction(BaseModel):
@@ -27,14 +29,41 @@ class ContractExtraction(BaseModel):
     total_value: float
     confidence_score: float = Field(ge=0.0, le=1.0)
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _fill_defaults_and_confidence(cls, data: Any) -> Any:
+        # Missing/null fields default to empty values. When no confidence is
+        # supplied it is derived deterministically from field completeness.
+        if not isinstance(data, dict):
+            return data
+
+        data = dict(data)
+        completeness = 0
+        for field in _REQUIRED_STRING_FIELDS:
+            value = data.get(field)
+            if value is None:
+                data[field] = ""
+            elif value:
+                completeness += 1
+
+        total_value = data.get("total_value")
+        if total_value is None or total_value == "":
+            data["total_value"] = 0.0
+        elif isinstance(total_value, (int, float)) and total_value > 0:
+            completeness += 1
+
+        if data.get("confidence_score") is None:
+            data["confidence_score"] = round(completeness / 4, 2)
+        return data
 
 
 class RetrievedPolicy(BaseModel):
     source: str
     content: str
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class ValidationResult(BaseModel):
@@ -43,11 +72,11 @@ class ValidationResult(BaseModel):
     requires_human_review: bool
     rationale: str
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class RoutingDecision(BaseModel):
     route: Literal["review_queue", "auto_approve"]
     reasons: list[str]
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
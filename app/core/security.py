@@ -1,5 +1,5 @@
+import hmac
 import logging
-import secrets
 
 from fastapi import Depends, Header, HTTPException, Request, status
 
@@ -28,25 +28,27 @@ def _verify_api_key(
         )
 
     if not x_api_key:
-        logger.warning(
-            "Unauthorized webhook request: missing API key",
-            extra={
-                "event": unauthorized_missing_event,
-                "client_host": request.client.host if request.client else None,
-                "path": request.url.path,
-            },
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Unauthorized webhook request: missing API key",
+                extra={
+                    "event": unauthorized_missing_event,
+                    "client_host": request.client.host if request.client else None,
+                    "path": request.url.path,
+                },
+            )
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing API key")
 
-    if not secrets.compare_digest(x_api_key, expected_secret):
-        logger.warning(
-            "Unauthorized webhook request: invalid API key",
-            extra={
-                "event": unauthorized_invalid_event,
-                "client_host": request.client.host if request.client else None,
-                "path": request.url.path,
-            },
-        )
+    if not hmac.compare_digest(x_api_key.encode("utf-8"), expected_secret.encode("utf-8")):
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Unauthorized webhook request: invalid API key",
+                extra={
+                    "event": unauthorized_invalid_event,
+                    "client_host": request.client.host if request.client else None,
+                    "path": request.url.path,
+                },
+            )
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
 
 
@@ -58,7 +60,7 @@ def verify_webhook_api_key(
     _verify_api_key(
         request=request,
         x_api_key=x_api_key,
-        expected_secret=settings.webhook_secret.strip(),
+        expected_secret=settings.resolved_webhook_secret,
         missing_secret_event="webhook_secret_missing",
         unauthorized_missing_event="webhook_unauthorized_missing_key",
         unauthorized_invalid_event="webhook_unauthorized_invalid_key",
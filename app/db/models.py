@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, Integer, MetaData, String, Text, func
+from sqlalchemy import JSON, DateTime, Float, ForeignKey, Index, Integer, MetaData, String, Text, func, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -19,6 +19,19 @@ class Base(DeclarativeBase):
 
 class ProcessedContract(Base):
     __tablename__ = "processed_contracts"
+    __table_args__ = (
+        Index("ix_processed_contracts_status_created_at", "status", "created_at"),
+        # Partial index for the keyset-paginated approved list: it holds only
+        # approved rows, and B-trees scan it backwards for the
+        # (updated_at DESC, id DESC) order.
+        Index(
+            "ix_processed_contracts_approved_updated_at_id",
+            "updated_at",
+            "id",
+            postgresql_where=text("status = 'approved'"),
+            sqlite_where=text("status = 'approved'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     sender: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -54,6 +67,17 @@ class ProcessedContract(Base):
 
 class ReviewQueue(Base):
     __tablename__ = "review_queue"
+    __table_args__ = (
+        Index("ix_review_queue_status_created_at", "status", "created_at"),
+        # Matches the pending review list's filter and (created_at, id) keyset.
+        Index(
+            "ix_review_queue_pending_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     contract_id: Mapped[int] = mapped_column(
@@ -82,3 +106,23 @@ class ProcessingLog(Base):
     message: Mapped[str] = mapped_column(Text, nullable=False)
     payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class LLMCache(Base):
+    __tablename__ = "llm_cache"
+
+    input_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    prompt_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    model: Mapped[str] = mapped_column(String(255), nullable=False)
+    response: Mapped[dict] = mapped_column(JSON, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class PipelineIdempotencyClaim(Base):
+    __tablename__ = "pipeline_idempotency_claims"
+
+    idempotency_key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    request_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -7,6 +7,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.core import json_codec
 from app.core.config import get_settings
 from app.db.models import Base
 
@@ -22,8 +23,24 @@ def get_engine() -> Engine:
     db_url = settings.resolved_database_url
     if not db_url:
         raise ValueError("DATABASE_URL is required and must be set in the environment")
-    connect_args = {"check_same_thread": False} if _is_sqlite(db_url) else {}
-    return create_engine(db_url, pool_pre_ping=True, connect_args=connect_args)
+    engine_kwargs: dict = {
+        "pool_pre_ping": True,
+        "json_serializer": json_codec.dumps,
+        "json_deserializer": json_codec.loads,
+    }
+    if _is_sqlite(db_url):
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    else:
+        # Each pipeline worker plus concurrent webhook/admin requests can hold
+        # a connection; the default 5+10 pool queues under that load.
+        pool_size = settings.db_pool_size or max(settings.pipeline_workers * 2, 10)
+        max_overflow = settings.db_max_overflow if settings.db_max_overflow is not None else pool_size
+        engine_kwargs.update(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=1800,
+        )
+    return create_engine(db_url, **engine_kwargs)
 
 
 engine: Engine | None = None
@@ -1,13 +1,14 @@
+"""Application logging configuration."""
 import logging
 import sys
 
-try:
-    from pythonjsonlogger import jsonlogger
-except ModuleNotFoundError:  # pragma: no cover - depends on runtime environment
-    jsonlogger = None
-
 
 def configure_logging(log_level: str = "INFO") -> None:
+    try:
+        from pythonjsonlogger import jsonlogger
+    except ModuleNotFoundError:  # pragma: no cover - depends on runtime environment
+        jsonlogger = None
+
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
     root_logger.setLevel(log_level.upper())
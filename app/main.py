@@ -16,6 +16,8 @@ from app.providers import build_chat_model
 from app.rag.retriever import PolicyRetriever
 from app.routers.email_router import build_email_router
 from app.routers.review_router import router as review_router
+from app.services.extraction_cache import ExtractionCache
+from app.services.idempotency_store import DatabaseIdempotencyStore
 from app.services.pipeline_executor import PipelineExecutor
 
 
@@ -33,7 +35,6 @@ def create_app() -> FastAPI:
         )
         raise RuntimeError(str(exc)) from exc
 
-    settings.upload_dir.mkdir(parents=True, exist_ok=True)
     Path(settings.chroma_persist_dir).mkdir(parents=True, exist_ok=True)
     settings.embedding_cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -54,14 +55,21 @@ def create_app() -> FastAPI:
         },
     )
 
+    policy_retriever = PolicyRetriever(settings)
+    document_processor = DocumentProcessor()
     orchestrator = ContractOrchestrator(
-        document_processor=DocumentProcessor(),
+        document_processor=document_processor,
         extraction_agent=ExtractionAgent(
             llm=extraction_chat_model,
             max_retries=settings.extraction_max_retries,
             max_input_chars=settings.extraction_max_input_chars,
+            cache=(
+                ExtractionCache(SessionLocal, ttl_seconds=settings.extraction_cache_ttl_seconds)
+                if settings.extraction_cache_enabled
+                else None
+            ),
         ),
-        policy_retriever=PolicyRetriever(settings),
+        policy_retriever=policy_retriever,
         validation_agent=ValidationAgent(
             llm=validation_chat_model,
             max_retries=settings.validation_max_retries,
@@ -73,10 +81,16 @@ def create_app() -> FastAPI:
         max_workers=settings.pipeline_workers,
         wait_timeout_seconds=settings.webhook_sync_timeout_seconds,
         idempotency_enabled=settings.webhook_idempotency_enabled,
+        idempotency_store=(
+            DatabaseIdempotencyStore(SessionLocal)
+            if settings.webhook_idempotency_store == "database"
+            else None
+        ),
     )
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
+        await policy_retriever.initialize()
         logger.info(
             "API startup complete",
             extra={"event": "api_startup_complete", "service": settings.app_name},
@@ -89,7 +103,8 @@ def create_app() -> FastAPI:
             },
         )
         yield
-        pipeline_executor.shutdown()
+        await pipeline_executor.shutdown()
+        document_processor.shutdown()
 
     app = FastAPI(title=settings.app_name, lifespan=lifespan)
     app.add_middleware(
@@ -102,7 +117,6 @@ def create_app() -> FastAPI:
     app.include_router(
         build_email_router(
             pipeline_executor=pipeline_executor,
-            upload_dir=settings.upload_dir,
             max_upload_size_bytes=settings.max_upload_size_bytes,
         )
     )
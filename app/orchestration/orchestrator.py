@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 from datetime import datetime, timezone
@@ -28,9 +29,11 @@ class ContractState(TypedDict):
     sender: str
     subject: str
     file_path: str
+    pdf_bytes: NotRequired[bytes]
     doc_text: NotRequired[DocumentText]
     extracted_contract: NotRequired[ContractExtraction]
     retrieved_policies: NotRequired[list[RetrievedPolicy]]
+    missing_required_fields: NotRequired[list[str]]
     validation_result: NotRequired[ValidationResult]
     routing_decision: NotRequired[RoutingDecision]
     extraction_usage: NotRequired[dict]
@@ -57,7 +60,23 @@ class ContractOrchestrator:
         self._persistence = ContractPersistenceService(session_factory)
         self._graph = self._compile_graph()
 
-    def run(self, sender: str, subject: str, file_path: str | Path) -> dict:
+    def run(
+        self,
+        sender: str,
+        subject: str,
+        file_path: str | Path,
+        pdf_bytes: bytes | None = None,
+    ) -> dict:
+        """Blocking entry point for callers outside an event loop."""
+        return asyncio.run(self.arun(sender, subject, file_path, pdf_bytes))
+
+    async def arun(
+        self,
+        sender: str,
+        subject: str,
+        file_path: str | Path,
+        pdf_bytes: bytes | None = None,
+    ) -> dict:
         pipeline_start = time.perf_counter()
         input_path = Path(file_path)
         state: ContractState = {
@@ -65,9 +84,11 @@ class ContractOrchestrator:
             "subject": subject,
             "file_path": str(input_path),
         }
+        if pdf_bytes is not None:
+            state["pdf_bytes"] = pdf_bytes
 
         try:
-            result = self._graph.invoke(state)
+            result = await self._graph.ainvoke(state)
             route_value: str | None = None
             routing_decision = result.get("routing_decision")
             if isinstance(routing_decision, RoutingDecision):
@@ -94,7 +115,8 @@ class ContractOrchestrator:
                     "file_path": str(input_path),
                 },
             )
-            contract_id = self._persistence.persist_failure_as_review(
+            contract_id = await asyncio.to_thread(
+                self._persistence.persist_failure_as_review,
                 sender=sender,
                 subject=subject,
                 file_path=str(input_path),
@@ -118,22 +140,39 @@ class ContractOrchestrator:
                 "Pipeline failed",
                 extra={"event": "pipeline_failed", "error": str(exc), "file_path": str(input_path)},
             )
-            self._persist_failure_log(sender=sender, subject=subject, file_path=str(input_path), error=str(exc))
+            await asyncio.to_thread(
+                self._persist_failure_log,
+                sender=sender,
+                subject=subject,
+                file_path=str(input_path),
+                error=str(exc),
+            )
             raise
         finally:
-            self._cleanup_uploaded_file(input_path)
+            # In-memory uploads never touched the disk.
+            if pdf_bytes is None:
+                self._cleanup_uploaded_file(input_path)
 
     def _compile_graph(self):
         graph = StateGraph(ContractState)
         graph.add_node("ingest", self._ingest_node)
         graph.add_node("extract", self._extract_node)
+        graph.add_node("retrieve", self._retrieve_node)
+        graph.add_node("prepare", self._prepare_validation_node)
         graph.add_node("validate", self._validate_node)
         graph.add_node("route", self._route_node)
         graph.add_node("persist", self._persist_node)
 
+        # Under ainvoke LangGraph runs the synchronous nodes (PDF parsing,
+        # retrieval, persistence) in worker threads; only the LLM call is
+        # awaited natively.
         graph.set_entry_point("ingest")
         graph.add_edge("ingest", "extract")
-        graph.add_edge("extract", "validate")
+        # Policy retrieval (embedding + vector search) runs concurrently with
+        # the policy-independent validation checks; `validate` joins both.
+        graph.add_edge("extract", "retrieve")
+        graph.add_edge("extract", "prepare")
+        graph.add_edge(["retrieve", "prepare"], "validate")
         graph.add_edge("validate", "route")
         graph.add_edge("route", "persist")
         graph.add_edge("persist", END)
@@ -148,11 +187,15 @@ class ContractOrchestrator:
             received_at=datetime.now(timezone.utc),
         )
 
-        doc_text = self._document_processor.extract_document_text(state["file_path"], metadata)
+        doc_text = self._document_processor.extract_document_text(
+            state["file_path"],
+            metadata,
+            pdf_bytes=state.get("pdf_bytes"),
+        )
         return {"doc_text": doc_text}
 
-    def _extract_node(self, state: ContractState) -> dict:
-        extracted_contract, usage, latency_ms = self._extraction_agent.extract(state["doc_text"])
+    async def _extract_node(self, state: ContractState) -> dict:
+        extracted_contract, usage, latency_ms = await self._extraction_agent.aextract(state["doc_text"])
 
         self._logger.info(
             "Extraction completed",
@@ -171,11 +214,19 @@ class ContractOrchestrator:
             "extraction_latency_ms": latency_ms,
         }
 
-    def _validate_node(self, state: ContractState) -> dict:
+    def _retrieve_node(self, state: ContractState) -> dict:
         policies = self._policy_retriever.retrieve_relevant_policies(state["extracted_contract"])
+        return {"retrieved_policies": policies}
+
+    def _prepare_validation_node(self, state: ContractState) -> dict:
+        missing_fields = self._validation_agent.missing_required_fields(state["extracted_contract"])
+        return {"missing_required_fields": missing_fields}
+
+    def _validate_node(self, state: ContractState) -> dict:
         validation, usage, latency_ms = self._validation_agent.validate(
             contract=state["extracted_contract"],
-            policies=policies,
+            policies=state["retrieved_policies"],
+            missing_fields=state.get("missing_required_fields"),
         )
 
         self._logger.info(
@@ -191,7 +242,6 @@ class ContractOrchestrator:
         )
 
         return {
-            "retrieved_policies": policies,
             "validation_result": validation,
             "validation_usage": usage,
             "validation_latency_ms": latency_ms,
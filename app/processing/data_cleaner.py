@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 import json
 import math
 import re
@@ -8,7 +9,7 @@ from typing import Any, get_args, get_origin
 
 from pydantic import BaseModel
 
-_NULLISH = {
+_NULLISH = frozenset({
     "",
     "-",
     "n/a",
@@ -19,12 +20,18 @@ _NULLISH = {
     "unknown",
     "not specified",
     "not available",
-}
+})
+# str.lower() never shortens a string, so anything longer than the longest
+# token can be rejected without allocating a lowercased copy.
+_NULLISH_MAX_LEN = max(map(len, _NULLISH))
+_TRUTHY = frozenset({"true", "yes", "y", "1"})
+_TRUTHY_MAX_LEN = max(map(len, _TRUTHY))
 _WHITESPACE_RE = re.compile(r"\s+")
 _NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
 _ORDINAL_SUFFIX_RE = re.compile(r"(?<=\d)(st|nd|rd|th)", flags=re.IGNORECASE)
+_THOUSANDS_SEPARATOR_TABLE = str.maketrans("", "", ",")
 _CURRENCY_WORD_RE = re.compile(
-    r"(?i)\b(usd|us\$|dollars?|eur|euro|gbp|pounds?|lkr|rs|inr)\b"
+    r"(?i)\b(?:usd|us\$|dollars?|eur|euro|gbp|pounds?|lkr|rs|inr)\b"
 )
 _MAGNITUDE_TOKEN_RE = re.compile(
     r"(?i)(k|m|b|thousand|million|billion)\b"
@@ -37,17 +44,20 @@ _MAGNITUDE = {
     "b": 1_000_000_000.0,
     "billion": 1_000_000_000.0,
 }
-_DATE_FORMATS = [
-    "%Y-%m-%d",
-    "%Y/%m/%d",
-    "%m/%d/%Y",
-    "%d/%m/%Y",
-    "%d-%m-%Y",
-    "%B %d, %Y",
-    "%b %d, %Y",
-    "%d %B %Y",
-    "%d %b %Y",
-]
+# Numeric layouts are recognised with one regex and built directly: "Y-M-D" or
+# "Y/M/D", then "M/D/Y" before "D/M/Y", then "D-M-Y". The pieces are the
+# patterns strptime itself uses for %Y, %m and %d, so the same strings parse.
+_STRPTIME_YEAR = r"\d\d\d\d"
+_STRPTIME_MONTH = r"1[0-2]|0[1-9]|[1-9]"
+_STRPTIME_DAY = r"3[01]|[12]\d|0[1-9]|[1-9]| [1-9]"
+_NUMERIC_DATE_RE = re.compile(
+    rf"({_STRPTIME_YEAR})([-/])({_STRPTIME_MONTH})\2({_STRPTIME_DAY})"
+    rf"|({_STRPTIME_DAY})([-/])({_STRPTIME_DAY})\6({_STRPTIME_YEAR})"
+)
+_MONTH_RE = re.compile(_STRPTIME_MONTH)
+# Month-name layouts still go through strptime, chosen by the leading char.
+_DAY_FIRST_DATE_FORMATS = ("%d %B %Y", "%d %b %Y")
+_MONTH_FIRST_DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y")
 
 
 def clean_payload_for_model(payload: Any, model: type[BaseModel]) -> dict[str, Any]:
@@ -55,18 +65,25 @@ def clean_payload_for_model(payload: Any, model: type[BaseModel]) -> dict[str, A
         raise ValueError("Extraction payload is not a JSON object")
 
     cleaned: dict[str, Any] = {}
-    for field_name, field in model.model_fields.items():
+    for field_name, target_type in _resolved_fields(model):
         if field_name not in payload:
             continue
-        target_type = _resolve_target_type(field.annotation)
         cleaned[field_name] = _coerce_value(
             field_name=field_name,
-            value=payload.get(field_name),
+            value=payload[field_name],
             target_type=target_type,
         )
     return cleaned
 
 
+@lru_cache(maxsize=None)
+def _resolved_fields(model: type[BaseModel]) -> tuple[tuple[str, Any], ...]:
+    return tuple(
+        (field_name, _resolve_target_type(field.annotation))
+        for field_name, field in model.model_fields.items()
+    )
+
+
 def _resolve_target_type(annotation: Any) -> Any:
     origin = get_origin(annotation)
     if origin is None:
@@ -101,8 +118,12 @@ def _to_text(value: Any, *, field_name: str) -> str:
     else:
         text = str(value)
 
-    text = _WHITESPACE_RE.sub(" ", text).strip()
-    if text.lower() in _NULLISH:
+    # isprintable() is False for every whitespace character except " ", so
+    # clean single-spaced values can skip the regex.
+    if "  " in text or not text.isprintable():
+        text = _WHITESPACE_RE.sub(" ", text)
+    text = text.strip()
+    if len(text) <= _NULLISH_MAX_LEN and text.lower() in _NULLISH:
         return ""
 
     if "date" in field_name.lower():
@@ -121,19 +142,20 @@ def _to_number(value: Any) -> float | None:
         return parsed if math.isfinite(parsed) else None
 
     text = str(value).strip()
-    if not text or text.lower() in _NULLISH:
+    if not text or (len(text) <= _NULLISH_MAX_LEN and text.lower() in _NULLISH):
         return None
 
+    if _NUMBER_RE.fullmatch(text):
+        parsed = float(text)
+        return parsed if math.isfinite(parsed) else None
+
     negative = text.startswith("(") and text.endswith(")")
     if negative:
         text = text[1:-1].strip()
 
-    text = text.replace(",", "")
-    text = _CURRENCY_WORD_RE.sub("", text)
-    text = text.replace("$", " ")
-    text = text.replace("€", " ")
-    text = text.replace("£", " ")
-    text = _WHITESPACE_RE.sub(" ", text).strip()
+    # The searches below only care whether "-" ends up next to the digits, so
+    # currency symbols and whitespace runs can be left in place.
+    text = _CURRENCY_WORD_RE.sub("", text.translate(_THOUSANDS_SEPARATOR_TABLE))
 
     match = _NUMBER_RE.search(text)
     if not match:
@@ -161,20 +183,48 @@ def _to_bool(value: Any) -> bool:
     if isinstance(value, (int, float)):
         return value != 0
     if isinstance(value, str):
-        normalized = value.strip().lower()
-        if normalized in {"true", "yes", "y", "1"}:
-            return True
-        if normalized in {"false", "no", "n", "0"}:
-            return False
+        # Falsy spellings and unrecognised text both map to False.
+        normalized = value.strip()
+        return len(normalized) <= _TRUTHY_MAX_LEN and normalized.lower() in _TRUTHY
     return False
 
 
 def _parse_date_to_iso(value: str) -> str | None:
     normalized = _ORDINAL_SUFFIX_RE.sub("", value.strip())
     normalized = _WHITESPACE_RE.sub(" ", normalized)
-    for date_format in _DATE_FORMATS:
+
+    match = _NUMERIC_DATE_RE.fullmatch(normalized)
+    if match:
+        return _numeric_date_to_iso(match)
+
+    date_formats = (
+        _DAY_FIRST_DATE_FORMATS if normalized[:1].isdigit() else _MONTH_FIRST_DATE_FORMATS
+    )
+    for date_format in date_formats:
         try:
             return datetime.strptime(normalized, date_format).date().isoformat()
         except ValueError:
             continue
     return None
+
+
+def _numeric_date_to_iso(match: re.Match[str]) -> str | None:
+    year, _, month, day = match.group(1, 2, 3, 4)
+    if year is not None:
+        candidates = ((month, day),)
+    else:
+        first, separator, second, year = match.group(5, 6, 7, 8)
+        # "/" is read month-first, then day-first; "-" is day-first only.
+        if separator == "/":
+            candidates = ((first, second), (second, first))
+        else:
+            candidates = ((second, first),)
+
+    for month, day in candidates:
+        if not _MONTH_RE.fullmatch(month):
+            continue
+        try:
+            return date(int(year), int(month), int(day)).isoformat()
+        except ValueError:
+            continue
+    return None
@@ -1,32 +1,88 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import logging
+from pathlib import Path
 import re
+import threading
 import time
 import unicodedata
-from pathlib import Path
 
 from app.core.errors import DocumentProcessingError
 from app.core.schemas import DocumentMetadata, DocumentText
-from app.processing.pdf_utils import load_pymupdf_module
+from app.processing.pdf_utils import (
+    create_page_pool,
+    extract_pdf_text,
+    extract_pdf_text_parallel,
+    load_pymupdf_module,
+    open_pdf,
+)
 
 fitz = load_pymupdf_module()
 
+# One pass equivalent to: [\t\r\f\v]+ -> " ", then \n{3,} -> "\n\n", then [ ]{2,} -> " ".
+# Newline runs and horizontal whitespace runs never overlap, so they can be
+# rewritten together; any tab-class char or 2+ mixed blanks become one space.
+_NORMALIZE_RE = re.compile(r"(\n{3,})|[ \t\r\f\v]{2,}|[\t\r\f\v]")
+
+
+def _normalize_sub(match: re.Match[str]) -> str:
+    return "\n\n" if match.group(1) else " "
+
 
 class DocumentProcessor:
-    def extract_document_text(self, file_path: str | Path, metadata: DocumentMetadata) -> DocumentText:
+    def __init__(self, parallel_page_threshold: int = 64, max_page_workers: int = 4) -> None:
+        # Process start-up costs more than extracting typical contracts, so
+        # only very long PDFs are split across workers.
+        self._logger = logging.getLogger(__name__)
+        self._parallel_page_threshold = max(parallel_page_threshold, 2)
+        self._max_page_workers = max(max_page_workers, 1)
+        # Created on the first long document, then reused for every other one.
+        self._page_pool: ProcessPoolExecutor | None = None
+        self._page_pool_lock = threading.Lock()
+
+    def __enter__(self) -> DocumentProcessor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        with self._page_pool_lock:
+            pool, self._page_pool = self._page_pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def extract_document_text(
+        self,
+        file_path: str | Path,
+        metadata: DocumentMetadata,
+        pdf_bytes: bytes | None = None,
+    ) -> DocumentText:
+        """Extract normalized text from the PDF at `file_path`.
+
+        When `pdf_bytes` is given the document is read from memory and
+        `file_path` only identifies the upload in metadata.
+        """
         path = Path(file_path)
         start = time.perf_counter()
 
-        if not path.exists():
+        if pdf_bytes is None and not path.exists():
             raise DocumentProcessingError(f"File not found: {path}")
 
+        source = path if pdf_bytes is None else pdf_bytes
         try:
-            pages: list[str] = []
-            with fitz.open(path) as doc:
-                for page in doc:
-                    pages.append(page.get_text("text"))
+            with open_pdf(source) as doc:
+                page_count = doc.page_count
+                parallel = page_count >= self._parallel_page_threshold and self._max_page_workers > 1
+                if not parallel:
+                    raw_text = extract_pdf_text(doc).strip()
+            if parallel:
+                raw_text = self._extract_parallel(source, page_count).strip()
         except (fitz.FileDataError, RuntimeError, ValueError) as exc:
             raise DocumentProcessingError("Invalid or corrupted PDF file") from exc
 
-        raw_text = "\n".join(pages).strip()
         if not raw_text:
             raise DocumentProcessingError("PDF did not contain extractable text")
 
@@ -42,10 +98,31 @@ class DocumentProcessor:
             },
         )
 
+    def _extract_parallel(self, source: Path | bytes, page_count: int) -> str:
+        with self._page_pool_lock:
+            if self._page_pool is None:
+                self._page_pool = create_page_pool(self._max_page_workers)
+            pool = self._page_pool
+        try:
+            return extract_pdf_text_parallel(source, page_count, pool, self._max_page_workers)
+        except BrokenProcessPool as exc:
+            # BrokenProcessPool is a RuntimeError, but a crashed or OOM-killed
+            # worker says nothing about the document: drop the pool so the next
+            # long document gets a fresh one, and extract this one serially.
+            self._logger.warning(
+                "PDF worker pool broke; extracting serially",
+                extra={"event": "pdf_worker_pool_broken", "page_count": page_count, "error": str(exc)},
+            )
+            with self._page_pool_lock:
+                if self._page_pool is pool:
+                    self._page_pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            with open_pdf(source) as doc:
+                return extract_pdf_text(doc)
+
     @staticmethod
     def _normalize_text(text: str) -> str:
-        text = unicodedata.normalize("NFKC", text)
-        text = re.sub(r"[\t\r\f\v]+", " ", text)
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        text = re.sub(r"[ ]{2,}", " ", text)
-        return text.strip()
+        # NFKC is the identity on ASCII, which most contract PDFs are.
+        if not text.isascii():
+            text = unicodedata.normalize("NFKC", text)
+        return _NORMALIZE_RE.sub(_normalize_sub, text).strip()
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from pathlib import Path
+import tempfile
+from typing import Any
+
 
 def load_pymupdf_module():
     """Return a PyMuPDF-compatible module as `fitz`.
@@ -20,3 +26,62 @@ def load_pymupdf_module():
                 "PyMuPDF is not installed in the active environment. "
                 "Install with: pip install PyMuPDF"
             ) from exc
+
+
+def extract_pdf_text(doc: Any) -> str:
+    """Join the plain text of every page of an open PyMuPDF document."""
+    return "\n".join(page.get_text("text") for page in doc)
+
+
+def open_pdf(source: str | Path | bytes) -> Any:
+    """Open a PDF from a filesystem path or from its raw bytes."""
+    fitz = load_pymupdf_module()
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+def create_page_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Worker pool for `extract_pdf_text_parallel`, meant to live for the process."""
+    # `spawn` avoids forking a process that is already running pipeline threads,
+    # and the initializer imports PyMuPDF once per worker rather than per task.
+    return ProcessPoolExecutor(
+        max_workers=max(max_workers, 1),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=load_pymupdf_module,
+    )
+
+
+def extract_pdf_text_parallel(
+    source: str | Path | bytes,
+    page_count: int,
+    executor: ProcessPoolExecutor,
+    max_workers: int,
+) -> str:
+    """Extract page text across worker processes, preserving page order.
+
+    MuPDF is not thread-safe and PyMuPDF holds the GIL while extracting, so a
+    thread pool would not parallelize. Each worker opens its own document
+    handle and extracts a contiguous page range; the result matches
+    `extract_pdf_text` on the same document.
+    """
+    if isinstance(source, bytes):
+        # Deliberate tradeoff: in-memory uploads are spilled to one temporary
+        # file that workers open by path. Passing the bytes instead would pickle
+        # the whole document through a pipe once per page range, which costs
+        # more than one local write for the long PDFs that take this path.
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as spilled:
+            spilled.write(source)
+            spilled.flush()
+            return extract_pdf_text_parallel(spilled.name, page_count, executor, max_workers)
+
+    workers = max(min(max_workers, page_count), 1)
+    step = -(-page_count // workers)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    chunks = executor.map(_extract_page_range, [str(source)] * len(ranges), *zip(*ranges))
+    return "\n".join(chunks)
+
+
+def _extract_page_range(source: str, start: int, stop: int) -> str:
+    with open_pdf(source) as doc:
+        return "\n".join(doc[index].get_text("text") for index in range(start, stop))
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+try:
+    import re2
+except ModuleNotFoundError:  # pragma: no cover - depends on runtime environment
+    re2 = None
+
+
+def compile_linear_pattern(pattern: str, stdlib_pattern: str | None = None) -> Any:
+    """Compile `pattern` with RE2 (linear-time DFA) when `google-re2` is installed.
+
+    Falls back to the stdlib `re` module, optionally with `stdlib_pattern` for
+    callers that need backtracking guards RE2 does not accept (e.g. possessive
+    quantifiers). Both engines expose the same `search`/`finditer`/`split` API.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:  # pragma: no cover - pattern outside RE2 syntax
+            pass
+    return re.compile(stdlib_pattern or pattern)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import threading
+from typing import Any
+
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models.chat_models import BaseChatModel
 
@@ -10,6 +13,13 @@ class ProviderConfigurationError(ValueError):
     """Raised when provider env configuration is invalid."""
 
 
+# Clients hold connection pools and encoders hold hundreds of MB of weights, so
+# identically configured callers share one instance per process.
+_CHAT_MODEL_CACHE: dict[tuple[Any, ...], BaseChatModel] = {}
+_EMBEDDINGS_CACHE: dict[tuple[Any, ...], Embeddings] = {}
+_CACHE_LOCK = threading.Lock()
+
+
 def build_chat_model(settings: Settings, model_name: str | None = None) -> BaseChatModel:
     from langchain_anthropic import ChatAnthropic
 
@@ -24,27 +34,62 @@ def build_chat_model(settings: Settings, model_name: str | None = None) -> BaseC
             "Model id is required and must be a valid Anthropic model id."
         )
 
-    return ChatAnthropic(
-        model=resolved_model,
-        temperature=0,
-        timeout=settings.llm_timeout_seconds,
-        api_key=api_key,
-    )
+    key = (resolved_model, settings.llm_timeout_seconds, api_key)
+    with _CACHE_LOCK:
+        chat_model = _CHAT_MODEL_CACHE.get(key)
+        if chat_model is None:
+            # run_structured_llm retries the same transient errors the SDK
+            # would; retrying in both layers multiplies the worst-case stall.
+            chat_model = ChatAnthropic(
+                model=resolved_model,
+                temperature=0,
+                timeout=settings.llm_timeout_seconds,
+                max_retries=0,
+                api_key=api_key,
+            )
+            _CHAT_MODEL_CACHE[key] = chat_model
+        return chat_model
 
 
 def build_embeddings(settings: Settings) -> Embeddings:
-    from langchain_huggingface import HuggingFaceEmbeddings
     if not settings.embedding_model.strip():
         raise ProviderConfigurationError(
             "EMBEDDING_MODEL is required for RAG retrieval."
         )
 
-    return HuggingFaceEmbeddings(
-        model_name=settings.embedding_model,
-        cache_folder=str(settings.embedding_cache_dir),
-        model_kwargs={
-            "device": settings.embedding_device,
-            "local_files_only": settings.embedding_local_files_only,
-        },
-        encode_kwargs={"normalize_embeddings": True},
+    key = (
+        settings.embedding_model,
+        str(settings.embedding_cache_dir),
+        settings.embedding_device,
+        settings.embedding_local_files_only,
+        settings.embedding_batch_size,
+        settings.embedding_backend,
+        settings.embedding_onnx_file,
     )
+    with _CACHE_LOCK:
+        embeddings = _EMBEDDINGS_CACHE.get(key)
+        if embeddings is None:
+            from langchain_huggingface import HuggingFaceEmbeddings
+
+            model_kwargs: dict[str, Any] = {
+                "device": settings.embedding_device,
+                "local_files_only": settings.embedding_local_files_only,
+            }
+            if settings.embedding_backend == "onnx":
+                model_kwargs["backend"] = "onnx"
+                model_kwargs["model_kwargs"] = {
+                    "file_name": settings.embedding_onnx_file,
+                    "provider": "CPUExecutionProvider",
+                }
+
+            embeddings = HuggingFaceEmbeddings(
+                model_name=settings.embedding_model,
+                cache_folder=str(settings.embedding_cache_dir),
+                model_kwargs=model_kwargs,
+                encode_kwargs={
+                    "normalize_embeddings": True,
+                    "batch_size": max(settings.embedding_batch_size, 1),
+                },
+            )
+            _EMBEDDINGS_CACHE[key] = embeddings
+        return embeddings
@@ -1,5 +1,6 @@
 import logging
 from pathlib import Path
+import uuid
 
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
@@ -7,7 +8,7 @@ from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_chroma import Chroma
 
 from app.core.config import get_settings
-from app.processing.pdf_utils import load_pymupdf_module
+from app.processing.pdf_utils import extract_pdf_text, load_pymupdf_module
 from app.rag.chroma_settings import build_chroma_client_settings
 from app.providers import build_embeddings
 
@@ -55,7 +56,7 @@ class PolicyIndexer:
                 client_settings=client_settings,
             )
 
-        vector_store.add_documents(chunks)
+        self._add_chunks(vector_store, chunks)
 
         self._logger.info(
             "Indexed policy documents",
@@ -67,6 +68,24 @@ class PolicyIndexer:
         )
         return len(chunks)
 
+    def _add_chunks(self, vector_store: Chroma, chunks: list[Document]) -> None:
+        # Encode the whole corpus in one batched call, then upsert in slices
+        # the Chroma client accepts; add_documents fails past that limit.
+        texts = [chunk.page_content for chunk in chunks]
+        vectors = self._embeddings.embed_documents(texts)
+        ids = [uuid.uuid4().hex for _ in texts]
+        metadatas = [chunk.metadata for chunk in chunks]
+
+        step = vector_store._client.get_max_batch_size()
+        for start in range(0, len(texts), step):
+            stop = start + step
+            vector_store._collection.upsert(
+                ids=ids[start:stop],
+                embeddings=vectors[start:stop],
+                documents=texts[start:stop],
+                metadatas=metadatas[start:stop],
+            )
+
     def _load_documents(self, policy_dir: Path) -> list[Document]:
         docs: list[Document] = []
 
@@ -98,7 +117,7 @@ class PolicyIndexer:
     @staticmethod
     def _extract_pdf_text(file_path: Path) -> str:
         with fitz.open(file_path) as doc:
-            return "\n".join(page.get_text("text") for page in doc)
+            return extract_pdf_text(doc)
 
 
 def main() -> None:
@@ -1,3 +1,5 @@
+import asyncio
+from collections import OrderedDict
 import threading
 
 from langchain_chroma import Chroma
@@ -10,17 +12,37 @@ from app.rag.chroma_settings import build_chroma_client_settings
 
 
 class PolicyRetriever:
-    def __init__(self, settings: Settings, embeddings: Embeddings | None = None):
+    def __init__(
+        self,
+        settings: Settings,
+        embeddings: Embeddings | None = None,
+        embedding_cache_size: int = 256,
+    ):
         self._settings = settings
         self._embeddings = embeddings
         self._vector_store: Chroma | None = None
-        self._vector_store_lock = threading.Lock()
         self._k = settings.retrieval_k
+        # Repeat vendors produce identical queries; caching their vectors skips
+        # the encoder forward pass, which dominates retrieval latency.
+        self._embedding_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._embedding_cache_size = max(embedding_cache_size, 0)
+        self._embedding_cache_lock = threading.Lock()
+
+    async def initialize(self) -> None:
+        """Load the encoder and open the collection before serving requests.
+
+        Called from the application lifespan so model loading happens at
+        startup, and a failed download stops the app instead of the first request.
+        """
+        if self._vector_store is None:
+            self._vector_store = await asyncio.to_thread(self._build_vector_store)
 
     def retrieve_relevant_policies(self, contract_json: ContractExtraction) -> list[RetrievedPolicy]:
-        vector_store = self._get_vector_store()
+        vector_store = self._vector_store
+        if vector_store is None:
+            raise RuntimeError("PolicyRetriever.initialize() must be awaited before retrieval")
         query = self._build_query(contract_json)
-        docs = vector_store.similarity_search(query, k=self._k)
+        docs = vector_store.similarity_search_by_vector(self._embed_query(query), k=self._k)
 
         return [
             RetrievedPolicy(
@@ -30,30 +52,40 @@ class PolicyRetriever:
             for doc in docs
         ]
 
-    def _get_vector_store(self) -> Chroma:
-        if self._vector_store is not None:
-            return self._vector_store
+    def _build_vector_store(self) -> Chroma:
+        try:
+            embeddings = self._embeddings or build_embeddings(self._settings)
+            self._embeddings = embeddings
+            client_settings = build_chroma_client_settings(self._settings.chroma_persist_dir)
+            return Chroma(
+                collection_name=self._settings.chroma_collection,
+                embedding_function=embeddings,
+                persist_directory=str(self._settings.chroma_persist_dir),
+                client_settings=client_settings,
+            )
+        except Exception as exc:
+            raise RuntimeError(
+                "Failed to initialize embedding/vector store. "
+                "If running in Docker with restricted network, either fix DNS/network access to "
+                "huggingface.co or pre-cache the model and set EMBEDDING_LOCAL_FILES_ONLY=true."
+            ) from exc
 
-        with self._vector_store_lock:
-            if self._vector_store is not None:
-                return self._vector_store
+    def _embed_query(self, query: str) -> list[float]:
+        with self._embedding_cache_lock:
+            cached = self._embedding_cache.get(query)
+            if cached is not None:
+                self._embedding_cache.move_to_end(query)
+                return cached
 
-            try:
-                embeddings = self._embeddings or build_embeddings(self._settings)
-                client_settings = build_chroma_client_settings(self._settings.chroma_persist_dir)
-                self._vector_store = Chroma(
-                    collection_name=self._settings.chroma_collection,
-                    embedding_function=embeddings,
-                    persist_directory=str(self._settings.chroma_persist_dir),
-                    client_settings=client_settings,
-                )
-                return self._vector_store
-            except Exception as exc:
-                raise RuntimeError(
-                    "Failed to initialize embedding/vector store. "
-                    "If running in Docker with restricted network, either fix DNS/network access to "
-                    "huggingface.co or pre-cache the model and set EMBEDDING_LOCAL_FILES_ONLY=true."
-                ) from exc
+        # Encode outside the lock so concurrent misses do not serialize.
+        vector = self._embeddings.embed_query(query)
+        if self._embedding_cache_size:
+            with self._embedding_cache_lock:
+                self._embedding_cache[query] = vector
+                self._embedding_cache.move_to_end(query)
+                while len(self._embedding_cache) > self._embedding_cache_size:
+                    self._embedding_cache.popitem(last=False)
+        return vector
 
     @staticmethod
     def _build_query(contract: ContractExtraction) -> str:
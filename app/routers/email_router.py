@@ -10,18 +10,22 @@ from app.services.pipeline_executor import PipelineExecutor
 from app.services.webhook_service import build_deferred_webhook_response, build_webhook_response
 
 
+_PDF_MAGIC = b"%PDF-"
+_PDF_EOF_MARKER = b"%%EOF"
+# Readers accept the end-of-file marker anywhere in the final kilobyte.
+_PDF_EOF_WINDOW = 1024
+
+
 def _sanitize_log_value(value: str) -> str:
     return " ".join(value.splitlines()).strip()
 
 
 def build_email_router(
     pipeline_executor: PipelineExecutor,
-    upload_dir: Path,
     max_upload_size_bytes: int,
 ) -> APIRouter:
     router = APIRouter(prefix="", tags=["email"])
     logger = logging.getLogger(__name__)
-    upload_dir.mkdir(parents=True, exist_ok=True)
 
     @router.post("/email-webhook")
     async def email_webhook(
@@ -44,12 +48,11 @@ def build_email_router(
         if attachment.content_type != "application/pdf":
             raise HTTPException(status_code=400, detail="Invalid attachment content type")
 
-        file_id = uuid.uuid4().hex
-        target_path = upload_dir / f"{file_id}.pdf"
-
-        _save_pdf_attachment(
+        # The validated upload stays in memory; the name only identifies it in
+        # metadata and logs.
+        file_name = f"{uuid.uuid4().hex}.pdf"
+        pdf_bytes = _read_pdf_attachment(
             attachment=attachment,
-            target_path=target_path,
             max_upload_size_bytes=max_upload_size_bytes,
         )
 
@@ -59,7 +62,8 @@ def build_email_router(
                 "event": "email_webhook_received",
                 "sender": _sanitize_log_value(sender),
                 "subject": _sanitize_log_value(subject),
-                "file_path": str(target_path),
+                "file_path": file_name,
+                "size_bytes": len(pdf_bytes),
                 "idempotency_key_present": bool((x_idempotency_key or "").strip()),
             },
         )
@@ -67,7 +71,8 @@ def build_email_router(
         outcome = await pipeline_executor.submit_and_wait(
             sender=sender,
             subject=subject,
-            file_path=str(target_path),
+            file_path=file_name,
+            pdf_bytes=pdf_bytes,
             idempotency_key=x_idempotency_key,
         )
         processing_time_ms = int((time.perf_counter() - start) * 1000)
@@ -101,33 +106,33 @@ def build_email_router(
     return router
 
 
-def _save_pdf_attachment(
+def _read_pdf_attachment(
     *,
     attachment: UploadFile,
-    target_path: Path,
     max_upload_size_bytes: int,
-) -> None:
-    file_header = attachment.file.read(5)
+) -> bytes:
+    file_header = attachment.file.read(len(_PDF_MAGIC))
     attachment.file.seek(0)
-    if file_header != b"%PDF-":
+    if file_header != _PDF_MAGIC:
         raise HTTPException(status_code=400, detail="Attachment content is not a valid PDF")
 
-    bytes_written = 0
+    buffer = bytearray()
     chunk_size = 1024 * 1024
 
-    try:
-        with target_path.open("wb") as out_file:
-            while True:
-                chunk = attachment.file.read(chunk_size)
-                if not chunk:
-                    break
-                bytes_written += len(chunk)
-                if bytes_written > max_upload_size_bytes:
-                    raise HTTPException(
-                        status_code=413,
-                        detail=f"Attachment exceeds max size of {max_upload_size_bytes} bytes",
-                    )
-                out_file.write(chunk)
-    except Exception:
-        target_path.unlink(missing_ok=True)
-        raise
+    while True:
+        # Never ask for more than one byte past the limit, so an oversized
+        # upload is rejected without reading the rest of it.
+        chunk = attachment.file.read(min(chunk_size, max_upload_size_bytes - len(buffer) + 1))
+        if not chunk:
+            break
+        if len(buffer) + len(chunk) > max_upload_size_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Attachment exceeds max size of {max_upload_size_bytes} bytes",
+            )
+        buffer += chunk
+
+    # Truncated or junk uploads are rejected here rather than deep in PyMuPDF.
+    if buffer.find(_PDF_EOF_MARKER, max(len(buffer) - _PDF_EOF_WINDOW, 0)) == -1:
+        raise HTTPException(status_code=400, detail="Attachment content is not a valid PDF")
+    return bytes(buffer)
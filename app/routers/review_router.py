@@ -1,9 +1,13 @@
-from datetime import datetime, timezone
+import base64
+import binascii
+from datetime import datetime
+import hashlib
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import func, select, tuple_, update
 from sqlalchemy.orm import Session
 
+from app.core import json_codec
 from app.core.security import verify_admin_api_key
 from app.db.models import ProcessedContract, ReviewQueue
 from app.db.session import get_db
@@ -11,129 +15,193 @@ from app.db.session import get_db
 
 router = APIRouter(prefix="", tags=["review"], dependencies=[Depends(verify_admin_api_key)])
 
+# List endpoints select narrow rows: the large extracted/routing payloads never
+# leave the database and only the two validation keys they render are pulled.
+_RISK_LEVEL = ProcessedContract.validation_payload["risk_level"].as_string()
+_POLICY_VIOLATIONS = ProcessedContract.validation_payload["policy_violations"]
+# Admin dashboards poll the approved list; let them reuse a page briefly.
+_APPROVED_CACHE_CONTROL = "private, max-age=5"
 
-@router.get("/approved-contracts")
+
+def _encode_cursor(timestamp: datetime, row_id: int) -> str:
+    raw = f"{timestamp.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        timestamp, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from exc
+
+
+def _json_response(content: object, headers: dict[str, str] | None = None) -> Response:
+    # Rows are already plain JSON-ready values, so encode them directly rather
+    # than letting FastAPI walk every item through jsonable_encoder.
+    return Response(content=json_codec.dumps_bytes(content), media_type="application/json", headers=headers)
+
+
+@router.get("/approved-contracts", response_class=Response)
 def get_approved_contracts(
     limit: int = Query(default=50, ge=1, le=500),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(default=0, ge=0, description="Deprecated; use cursor."),
+    cursor: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> dict:
-    items = db.execute(
-        select(ProcessedContract)
+) -> Response:
+    # Approving a contract adds a row and bumps updated_at, so the newest
+    # timestamp plus the row count changes whenever any page could change.
+    latest_update, approved_count = db.execute(
+        select(func.max(ProcessedContract.updated_at), func.count()).where(
+            ProcessedContract.status == "approved"
+        )
+    ).one()
+    token = "|".join(
+        (
+            latest_update.isoformat() if latest_update else "",
+            str(approved_count),
+            str(limit),
+            str(offset),
+            cursor or "",
+        )
+    )
+    etag = f'"{hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": _APPROVED_CACHE_CONTROL}
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+
+    query = (
+        select(
+            ProcessedContract.id.label("contract_id"),
+            ProcessedContract.status,
+            ProcessedContract.route_decision,
+            ProcessedContract.sender,
+            ProcessedContract.subject,
+            ProcessedContract.vendor_name,
+            ProcessedContract.total_value,
+            ProcessedContract.governing_law,
+            ProcessedContract.extraction_confidence_score,
+            _RISK_LEVEL.label("risk_level"),
+            _POLICY_VIOLATIONS.label("policy_violations"),
+            ProcessedContract.updated_at.label("approved_at"),
+            ProcessedContract.created_at,
+        )
         .where(ProcessedContract.status == "approved")
         .order_by(ProcessedContract.updated_at.desc(), ProcessedContract.id.desc())
-        .offset(offset)
-        .limit(limit)
-    ).scalars().all()
-
-    return {
-        "count": len(items),
-        "limit": limit,
-        "offset": offset,
-        "items": [
-            {
-                "contract_id": contract.id,
-                "status": contract.status,
-                "route_decision": contract.route_decision,
-                "sender": contract.sender,
-                "subject": contract.subject,
-                "vendor_name": contract.vendor_name,
-                "total_value": contract.total_value,
-                "governing_law": contract.governing_law,
-                "extraction_confidence_score": contract.extraction_confidence_score,
-                "risk_level": contract.validation_payload.get("risk_level"),
-                "policy_violations": contract.validation_payload.get("policy_violations", []),
-                "approved_at": contract.updated_at,
-                "created_at": contract.created_at,
-            }
-            for contract in items
-        ],
-    }
-
-
-@router.get("/review-queue")
+    )
+    if cursor:
+        # Keyset pagination: seek past the last row of the previous page via
+        # the approved (updated_at, id) index instead of scanning `offset` rows.
+        cursor_updated_at, cursor_id = _decode_cursor(cursor)
+        query = query.where(
+            tuple_(ProcessedContract.updated_at, ProcessedContract.id) < tuple_(cursor_updated_at, cursor_id)
+        )
+    else:
+        query = query.offset(offset)
+
+    # The page is capped at 500 rows, so it is built in full before anything is
+    # sent: a database error still surfaces as a clean 500, not a truncated 200.
+    # One extra row tells whether another page exists without a COUNT query.
+    rows = db.execute(query.limit(limit + 1)).mappings().all()
+    has_more = len(rows) > limit
+    items = [{**row, "policy_violations": row["policy_violations"] or []} for row in rows[:limit]]
+    next_cursor = None
+    if has_more:
+        last_row = rows[limit - 1]
+        next_cursor = _encode_cursor(last_row["approved_at"], last_row["contract_id"])
+
+    return _json_response(
+        {
+            "items": items,
+            "count": len(items),
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        },
+        headers,
+    )
+
+
+@router.get("/review-queue", response_class=Response)
 def get_review_queue(
     limit: int = Query(default=100, ge=1, le=500),
-    offset: int = Query(default=0, ge=0),
+    offset: int = Query(default=0, ge=0, description="Deprecated; use cursor."),
+    cursor: str | None = Query(default=None),
     db: Session = Depends(get_db),
-) -> list[dict]:
-    items = db.execute(
-        select(ReviewQueue, ProcessedContract)
-        .join(ProcessedContract, ReviewQueue.contract_id == ProcessedContract.id)
+) -> Response:
+    query = (
+        select(
+            ReviewQueue.id.label("review_id"),
+            ProcessedContract.id.label("contract_id"),
+            ReviewQueue.status,
+            ReviewQueue.reason,
+            ProcessedContract.sender,
+            ProcessedContract.subject,
+            ProcessedContract.vendor_name,
+            _RISK_LEVEL.label("risk"),
+            _POLICY_VIOLATIONS.label("violations"),
+            ReviewQueue.created_at,
+        )
+        .join(ReviewQueue.contract)
         .where(ReviewQueue.status == "pending")
-        .order_by(ReviewQueue.created_at.asc())
-        .offset(offset)
-        .limit(limit)
-    ).all()
-
-    return [
-        {
-            "review_id": review.id,
-            "contract_id": contract.id,
-            "status": review.status,
-            "reason": review.reason,
-            "sender": contract.sender,
-            "subject": contract.subject,
-            "vendor_name": contract.vendor_name,
-            "risk": contract.validation_payload.get("risk_level"),
-            "violations": contract.validation_payload.get("policy_violations", []),
-            "created_at": review.created_at,
-        }
-        for review, contract in items
-    ]
-
-
-@router.post("/approve/{id}")
-def approve_review(id: int, db: Session = Depends(get_db)) -> dict:
-    review = db.execute(
-        select(ReviewQueue)
-        .where(ReviewQueue.id == id)
-        .with_for_update()
+        .order_by(ReviewQueue.created_at.asc(), ReviewQueue.id.asc())
+    )
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.where(
+            tuple_(ReviewQueue.created_at, ReviewQueue.id) > tuple_(cursor_created_at, cursor_id)
+        )
+    else:
+        query = query.offset(offset)
+
+    # The body stays a plain list for existing clients, so the cursor for the
+    # next page travels in a response header.
+    rows = db.execute(query.limit(limit + 1)).mappings().all()
+    items = rows[:limit]
+    headers = None
+    if len(rows) > limit:
+        headers = {"X-Next-Cursor": _encode_cursor(items[-1]["created_at"], items[-1]["review_id"])}
+
+    return _json_response([{**row, "violations": row["violations"] or []} for row in items], headers)
+
+
+def _resolve_review(db: Session, review_id: int, status: str) -> dict:
+    # The pending check lives in the UPDATE's WHERE clause, so two concurrent
+    # resolutions cannot both succeed and no row lock is taken up front.
+    contract_id = db.execute(
+        update(ReviewQueue)
+        .where(ReviewQueue.id == review_id, ReviewQueue.status == "pending")
+        .values(status=status, resolved_at=func.now())
+        .returning(ReviewQueue.contract_id)
     ).scalar_one_or_none()
-    if not review:
-        raise HTTPException(status_code=404, detail="Review item not found")
-    if review.status != "pending":
+    if contract_id is None:
+        exists = db.execute(select(ReviewQueue.id).where(ReviewQueue.id == review_id)).first()
+        if not exists:
+            raise HTTPException(status_code=404, detail="Review item not found")
         raise HTTPException(status_code=400, detail="Review item is not pending")
 
-    contract = db.execute(
-        select(ProcessedContract)
-        .where(ProcessedContract.id == review.contract_id)
-        .with_for_update()
-    ).scalar_one_or_none()
-    if not contract:
+    updated = db.execute(
+        update(ProcessedContract)
+        .where(ProcessedContract.id == contract_id)
+        .values(status=status)
+        .returning(ProcessedContract.id)
+    ).first()
+    if not updated:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Associated contract not found")
-
-    review.status = "approved"
-    review.resolved_at = datetime.now(timezone.utc)
-    contract.status = "approved"
     db.commit()
 
-    return {"status": "approved", "review_id": id, "contract_id": contract.id}
+    return {"status": status, "review_id": review_id, "contract_id": contract_id}
 
 
-@router.post("/reject/{id}")
-def reject_review(id: int, db: Session = Depends(get_db)) -> dict:
-    review = db.execute(
-        select(ReviewQueue)
-        .where(ReviewQueue.id == id)
-        .with_for_update()
-    ).scalar_one_or_none()
-    if not review:
-        raise HTTPException(status_code=404, detail="Review item not found")
-    if review.status != "pending":
-        raise HTTPException(status_code=400, detail="Review item is not pending")
-
-    contract = db.execute(
-        select(ProcessedContract)
-        .where(ProcessedContract.id == review.contract_id)
-        .with_for_update()
-    ).scalar_one_or_none()
-    if not contract:
-        raise HTTPException(status_code=404, detail="Associated contract not found")
+@router.post("/approve/{id}")
+def approve_review(id: int, db: Session = Depends(get_db)) -> dict:
+    return _resolve_review(db, id, "approved")
 
-    review.status = "rejected"
-    review.resolved_at = datetime.now(timezone.utc)
-    contract.status = "rejected"
-    db.commit()
 
-    return {"status": "rejected", "review_id": id, "contract_id": contract.id}
+@router.post("/reject/{id}")
+def reject_review(id: int, db: Session = Depends(get_db)) -> dict:
+    return _resolve_review(db, id, "rejected")
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import hashlib
+import logging
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.models import LLMCache
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class ExtractionCacheKey:
+    provider: str
+    model: str
+    prompt_version: str
+    text_hash: str
+
+    @classmethod
+    def for_text(cls, *, provider: str, model: str, prompt_version: str, text: str) -> ExtractionCacheKey:
+        return cls(
+            provider=provider,
+            model=model,
+            prompt_version=prompt_version,
+            text_hash=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        )
+
+    @property
+    def digest(self) -> str:
+        material = f"{self.provider}\x1f{self.model}\x1f{self.prompt_version}\x1f{self.text_hash}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """Content-addressable store of validated extraction payloads.
+
+    Lookups and writes are best-effort: database errors are logged and treated
+    as a cache miss so extraction never fails because of the cache.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._session_factory = session_factory
+        self._ttl = timedelta(seconds=max(ttl_seconds, 1))
+
+    def get(self, key: ExtractionCacheKey) -> dict[str, Any] | None:
+        now = datetime.now(timezone.utc)
+        try:
+            with self._session_factory() as session:
+                return session.execute(
+                    select(LLMCache.response).where(
+                        LLMCache.input_hash == key.digest,
+                        LLMCache.expires_at > now,
+                    )
+                ).scalar_one_or_none()
+        except SQLAlchemyError as exc:
+            self._log_failure("get", key, exc)
+            return None
+
+    def put(self, key: ExtractionCacheKey, payload: dict[str, Any]) -> None:
+        try:
+            with self._session_factory() as session:
+                session.merge(
+                    LLMCache(
+                        input_hash=key.digest,
+                        prompt_version=key.prompt_version,
+                        model=key.model,
+                        response=payload,
+                        expires_at=datetime.now(timezone.utc) + self._ttl,
+                    )
+                )
+                session.commit()
+        except SQLAlchemyError as exc:
+            self._log_failure("put", key, exc)
+
+    def _log_failure(self, operation: str, key: ExtractionCacheKey, exc: Exception) -> None:
+        self._logger.warning(
+            "Extraction cache operation failed",
+            extra={
+                "event": "extraction_cache_failed",
+                "operation": operation,
+                "model": key.model,
+                "prompt_version": key.prompt_version,
+                "error": str(exc),
+            },
+        )
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import logging
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.models import PipelineIdempotencyClaim
+
+DEFAULT_TTL_SECONDS = 60 * 60
+
+
+class DatabaseIdempotencyStore:
+    """Idempotency claims shared by every worker process through the database.
+
+    The primary key on the claim row makes the insert the arbiter, so two
+    workers racing on one key cannot both win. Expired claims (e.g. left by a
+    crashed worker) are cleared before claiming. Store errors are logged and
+    treated as a successful claim so webhooks never fail because of it; the
+    executor's in-process dedup still applies.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._session_factory = session_factory
+        self._ttl = timedelta(seconds=max(ttl_seconds, 1))
+
+    def claim(self, key: str, request_id: str) -> str | None:
+        now = datetime.now(timezone.utc)
+        try:
+            with self._session_factory() as session:
+                session.execute(
+                    delete(PipelineIdempotencyClaim).where(
+                        PipelineIdempotencyClaim.idempotency_key == key,
+                        PipelineIdempotencyClaim.expires_at <= now,
+                    )
+                )
+                session.add(
+                    PipelineIdempotencyClaim(
+                        idempotency_key=key,
+                        request_id=request_id,
+                        expires_at=now + self._ttl,
+                    )
+                )
+                try:
+                    session.commit()
+                    return None
+                except IntegrityError:
+                    session.rollback()
+                return session.execute(
+                    select(PipelineIdempotencyClaim.request_id).where(
+                        PipelineIdempotencyClaim.idempotency_key == key
+                    )
+                ).scalar_one_or_none()
+        except SQLAlchemyError as exc:
+            self._log_failure("claim", exc)
+            return None
+
+    def release(self, key: str, request_id: str) -> None:
+        try:
+            with self._session_factory() as session:
+                session.execute(
+                    delete(PipelineIdempotencyClaim).where(
+                        PipelineIdempotencyClaim.idempotency_key == key,
+                        PipelineIdempotencyClaim.request_id == request_id,
+                    )
+                )
+                session.commit()
+        except SQLAlchemyError as exc:
+            self._log_failure("release", exc)
+
+    def _log_failure(self, operation: str, exc: Exception) -> None:
+        self._logger.warning(
+            "Idempotency store operation failed",
+            extra={
+                "event": "idempotency_store_failed",
+                "operation": operation,
+                "error": str(exc),
+            },
+        )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.schemas import RoutingDecision, ValidationResult
@@ -13,74 +14,89 @@ class ContractPersistenceService:
         self._session_factory = session_factory
 
     def persist_success(self, state: dict[str, Any]) -> int:
+        # Everything below is written in one transaction with a single commit.
+        # Core inserts keep it to three statements: the contract insert returns
+        # its id, and the optional queue row and the stage logs follow. The
+        # schemas hold only JSON-native types, so a python-mode dump is enough
+        # and the engine's orjson serializer encodes each payload exactly once.
+        extraction = state["extracted_contract"]
+        routing = state["routing_decision"]
+        validation_payload = state["validation_result"].model_dump()
+        routing_payload = routing.model_dump()
+
         with self._session_factory() as session:
-            contract = ProcessedContract(
-                sender=state["sender"],
-                subject=state["subject"],
-                file_path=state["file_path"],
-                vendor_name=state["extracted_contract"].vendor_name,
-                contract_start_date=state["extracted_contract"].contract_start_date,
-                contract_end_date=state["extracted_contract"].contract_end_date,
-                total_value=state["extracted_contract"].total_value,
-                payment_terms_days=0,
-                auto_renewal=False,
-                termination_notice_days=0,
-                governing_law="",
-                extraction_confidence_score=state["extracted_contract"].confidence_score,
-                extracted_payload=state["extracted_contract"].model_dump(mode="json"),
-                validation_payload=state["validation_result"].model_dump(mode="json"),
-                routing_payload=state["routing_decision"].model_dump(mode="json"),
-                route_decision=state["routing_decision"].route,
-                status="approved" if state["routing_decision"].route == "auto_approve" else "pending_review",
-            )
-            session.add(contract)
-            session.flush()
+            contract_id = session.execute(
+                insert(ProcessedContract)
+                .values(
+                    sender=state["sender"],
+                    subject=state["subject"],
+                    file_path=state["file_path"],
+                    vendor_name=extraction.vendor_name,
+                    contract_start_date=extraction.contract_start_date,
+                    contract_end_date=extraction.contract_end_date,
+                    total_value=extraction.total_value,
+                    payment_terms_days=0,
+                    auto_renewal=False,
+                    termination_notice_days=0,
+                    governing_law="",
+                    extraction_confidence_score=extraction.confidence_score,
+                    extracted_payload=extraction.model_dump(),
+                    validation_payload=validation_payload,
+                    routing_payload=routing_payload,
+                    route_decision=routing.route,
+                    status="approved" if routing.route == "auto_approve" else "pending_review",
+                )
+                .returning(ProcessedContract.id)
+            ).scalar_one()
 
-            if state["routing_decision"].route == "review_queue":
-                queue_item = ReviewQueue(
-                    contract_id=contract.id,
-                    status="pending",
-                    reason="; ".join(state["routing_decision"].reasons),
+            if routing.route == "review_queue":
+                session.execute(
+                    insert(ReviewQueue).values(
+                        contract_id=contract_id,
+                        status="pending",
+                        reason="; ".join(routing.reasons),
+                    )
                 )
-                session.add(queue_item)
 
-            session.add_all(
+            session.execute(
+                insert(ProcessingLog),
                 [
-                    ProcessingLog(
-                        contract_id=contract.id,
-                        stage="extract",
-                        message="Extraction completed",
-                        payload={
+                    {
+                        "contract_id": contract_id,
+                        "stage": "extract",
+                        "message": "Extraction completed",
+                        "payload": {
                             "latency_ms": state.get("extraction_latency_ms", 0),
                             "token_usage": state.get("extraction_usage", {}),
                         },
-                    ),
-                    ProcessingLog(
-                        contract_id=contract.id,
-                        stage="validate",
-                        message="Validation completed",
-                        payload={
+                    },
+                    {
+                        "contract_id": contract_id,
+                        "stage": "validate",
+                        "message": "Validation completed",
+                        "payload": {
                             "latency_ms": state.get("validation_latency_ms", 0),
                             "token_usage": state.get("validation_usage", {}),
-                            "result": state["validation_result"].model_dump(mode="json"),
+                            "result": validation_payload,
                         },
-                    ),
-                    ProcessingLog(
-                        contract_id=contract.id,
-                        stage="route",
-                        message="Routing completed",
-                        payload=state["routing_decision"].model_dump(mode="json"),
-                    ),
-                ]
+                    },
+                    {
+                        "contract_id": contract_id,
+                        "stage": "route",
+                        "message": "Routing completed",
+                        # The full decision is already in the contract's routing_payload.
+                        "payload": {"route": routing.route},
+                    },
+                ],
             )
 
             session.commit()
-            return int(contract.id)
+            return int(contract_id)
 
     def persist_failure(self, sender: str, subject: str, file_path: str, error: str) -> None:
         with self._session_factory() as session:
-            session.add(
-                ProcessingLog(
+            session.execute(
+                insert(ProcessingLog).values(
                     contract_id=None,
                     stage="pipeline_error",
                     message="Pipeline failed",
@@ -105,38 +121,40 @@ class ContractPersistenceService:
         routing = RoutingDecision(route="review_queue", reasons=reasons)
 
         with self._session_factory() as session:
-            contract = ProcessedContract(
-                sender=sender,
-                subject=subject,
-                file_path=file_path,
-                vendor_name="",
-                contract_start_date="",
-                contract_end_date="",
-                total_value=0.0,
-                payment_terms_days=0,
-                auto_renewal=False,
-                termination_notice_days=0,
-                governing_law="",
-                extraction_confidence_score=0.0,
-                extracted_payload={"error": error},
-                validation_payload=validation.model_dump(mode="json"),
-                routing_payload=routing.model_dump(mode="json"),
-                route_decision=routing.route,
-                status="pending_review",
-            )
-            session.add(contract)
-            session.flush()
+            contract_id = session.execute(
+                insert(ProcessedContract)
+                .values(
+                    sender=sender,
+                    subject=subject,
+                    file_path=file_path,
+                    vendor_name="",
+                    contract_start_date="",
+                    contract_end_date="",
+                    total_value=0.0,
+                    payment_terms_days=0,
+                    auto_renewal=False,
+                    termination_notice_days=0,
+                    governing_law="",
+                    extraction_confidence_score=0.0,
+                    extracted_payload={"error": error},
+                    validation_payload=validation.model_dump(),
+                    routing_payload=routing.model_dump(),
+                    route_decision=routing.route,
+                    status="pending_review",
+                )
+                .returning(ProcessedContract.id)
+            ).scalar_one()
 
-            session.add(
-                ReviewQueue(
-                    contract_id=contract.id,
+            session.execute(
+                insert(ReviewQueue).values(
+                    contract_id=contract_id,
                     status="pending",
                     reason="; ".join(reasons),
                 )
             )
-            session.add(
-                ProcessingLog(
-                    contract_id=contract.id,
+            session.execute(
+                insert(ProcessingLog).values(
+                    contract_id=contract_id,
                     stage="pipeline_error",
                     message="Pipeline failed and was routed to review queue",
                     payload={
@@ -148,4 +166,4 @@ class ContractPersistenceService:
                 )
             )
             session.commit()
-            return int(contract.id)
+            return int(contract_id)
@@ -1,16 +1,29 @@
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
-import threading
 import uuid
 from typing import Any, Protocol
 
 
 class ContractPipeline(Protocol):
-    def run(self, sender: str, subject: str, file_path: str) -> dict[str, Any]:
+    async def arun(
+        self,
+        sender: str,
+        subject: str,
+        file_path: str,
+        pdf_bytes: bytes | None = None,
+    ) -> dict[str, Any]:
+        ...
+
+
+class IdempotencyStore(Protocol):
+    def claim(self, key: str, request_id: str) -> str | None:
+        """Claim `key` for `request_id`; return the current owner if another request holds it."""
+        ...
+
+    def release(self, key: str, request_id: str) -> None:
         ...
 
 
@@ -22,6 +35,14 @@ class PipelineExecutionOutcome:
 
 
 class PipelineExecutor:
+    """Runs pipelines as event-loop tasks, at most `max_workers` at a time.
+
+    Waiting on the LLM does not hold a thread, so concurrency is bounded by a
+    semaphore rather than a pool size. Tasks keep running after the sync wait
+    times out; `shutdown` waits for them. An optional `idempotency_store`
+    extends key dedup across worker processes; without it dedup is per process.
+    """
+
     def __init__(
         self,
         orchestrator: ContractPipeline,
@@ -29,17 +50,16 @@ class PipelineExecutor:
         max_workers: int,
         wait_timeout_seconds: int,
         idempotency_enabled: bool = True,
+        idempotency_store: IdempotencyStore | None = None,
     ) -> None:
         self._logger = logging.getLogger(__name__)
         self._orchestrator = orchestrator
         self._wait_timeout_seconds = max(wait_timeout_seconds, 1)
         self._idempotency_enabled = idempotency_enabled
-        self._pool = ThreadPoolExecutor(
-            max_workers=max(max_workers, 1),
-            thread_name_prefix="contract-pipeline",
-        )
-        self._lock = threading.Lock()
-        self._futures: dict[str, Future[dict[str, Any]]] = {}
+        self._idempotency_store = idempotency_store
+        self._max_workers = max(max_workers, 1)
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: dict[str, asyncio.Task[dict[str, Any]]] = {}
         self._idempotency_index: dict[str, str] = {}
 
     async def submit_and_wait(
@@ -48,18 +68,24 @@ class PipelineExecutor:
         sender: str,
         subject: str,
         file_path: str,
+        pdf_bytes: bytes | None = None,
         idempotency_key: str | None = None,
     ) -> PipelineExecutionOutcome:
-        request_id, future = self._get_or_submit(
+        request_id, task = await self._get_or_submit(
             sender=sender,
             subject=subject,
             file_path=file_path,
+            pdf_bytes=pdf_bytes,
             idempotency_key=idempotency_key,
         )
+        if task is None:
+            # Another worker process owns this key; report it as still running.
+            return PipelineExecutionOutcome(completed=False, request_id=request_id, result=None)
 
         try:
+            # shield() keeps the pipeline running when the wait times out.
             result = await asyncio.wait_for(
-                asyncio.wrap_future(future),
+                asyncio.shield(task),
                 timeout=self._wait_timeout_seconds,
             )
             return PipelineExecutionOutcome(
@@ -82,63 +108,106 @@ class PipelineExecutor:
                 result=None,
             )
 
-    def shutdown(self) -> None:
-        self._pool.shutdown(wait=True, cancel_futures=False)
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks.values())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-    def _get_or_submit(
+    async def _get_or_submit(
         self,
         *,
         sender: str,
         subject: str,
         file_path: str,
+        pdf_bytes: bytes | None,
         idempotency_key: str | None,
-    ) -> tuple[str, Future[dict[str, Any]]]:
-        normalized_key = (idempotency_key or "").strip()
-
-        with self._lock:
-            if self._idempotency_enabled and normalized_key:
-                existing_request_id = self._idempotency_index.get(normalized_key)
-                if existing_request_id:
-                    existing_future = self._futures.get(existing_request_id)
-                    if existing_future and not existing_future.done():
-                        self._logger.info(
-                            "Reusing in-flight pipeline execution for idempotency key",
-                            extra={
-                                "event": "pipeline_idempotency_reused",
-                                "request_id": existing_request_id,
-                            },
-                        )
-                        return existing_request_id, existing_future
-
-            request_id = uuid.uuid4().hex
-            future = self._pool.submit(self._orchestrator.run, sender, subject, file_path)
-            self._futures[request_id] = future
-
-            if self._idempotency_enabled and normalized_key:
-                self._idempotency_index[normalized_key] = request_id
-
-            future.add_done_callback(
-                lambda fut, rid=request_id, key=normalized_key: self._on_done(
-                    request_id=rid,
-                    idempotency_key=key,
-                    future=fut,
+    ) -> tuple[str, asyncio.Task[dict[str, Any]] | None]:
+        # Only ever called on the event loop thread, so no lock is needed.
+        normalized_key = (idempotency_key or "").strip() if self._idempotency_enabled else ""
+
+        if normalized_key:
+            existing = self._inflight(self._idempotency_index.get(normalized_key))
+            if existing is not None:
+                return existing
+
+        request_id = uuid.uuid4().hex
+        if normalized_key and self._idempotency_store is not None:
+            owner = await asyncio.to_thread(self._idempotency_store.claim, normalized_key, request_id)
+            if owner is not None:
+                # The owner may be a local request that claimed while we waited.
+                existing = self._inflight(owner)
+                if existing is not None:
+                    return existing
+                self._logger.info(
+                    "Idempotency key is claimed by another worker",
+                    extra={"event": "pipeline_idempotency_claimed_elsewhere", "request_id": owner},
                 )
+                return owner, None
+
+        task = asyncio.create_task(
+            self._run_bounded(sender, subject, file_path, pdf_bytes, request_id, normalized_key),
+            name=f"contract-pipeline-{request_id}",
+        )
+        self._tasks[request_id] = task
+
+        if normalized_key:
+            self._idempotency_index[normalized_key] = request_id
+
+        task.add_done_callback(
+            lambda fut, rid=request_id, key=normalized_key: self._on_done(
+                request_id=rid,
+                idempotency_key=key,
+                task=fut,
             )
-            return request_id, future
+        )
+        return request_id, task
+
+    def _inflight(self, request_id: str | None) -> tuple[str, asyncio.Task[dict[str, Any]]] | None:
+        task = self._tasks.get(request_id) if request_id else None
+        if task is None or task.done():
+            return None
+        self._logger.info(
+            "Reusing in-flight pipeline execution for idempotency key",
+            extra={
+                "event": "pipeline_idempotency_reused",
+                "request_id": request_id,
+            },
+        )
+        return request_id, task
+
+    async def _run_bounded(
+        self,
+        sender: str,
+        subject: str,
+        file_path: str,
+        pdf_bytes: bytes | None,
+        request_id: str,
+        idempotency_key: str,
+    ) -> dict[str, Any]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_workers)
+        try:
+            async with self._semaphore:
+                return await self._orchestrator.arun(sender, subject, file_path, pdf_bytes)
+        finally:
+            if idempotency_key and self._idempotency_store is not None:
+                await asyncio.to_thread(self._idempotency_store.release, idempotency_key, request_id)
 
     def _on_done(
         self,
         *,
         request_id: str,
         idempotency_key: str,
-        future: Future[dict[str, Any]],
+        task: asyncio.Task[dict[str, Any]],
     ) -> None:
-        with self._lock:
-            self._futures.pop(request_id, None)
-            if idempotency_key and self._idempotency_index.get(idempotency_key) == request_id:
-                self._idempotency_index.pop(idempotency_key, None)
+        self._tasks.pop(request_id, None)
+        if idempotency_key and self._idempotency_index.get(idempotency_key) == request_id:
+            self._idempotency_index.pop(idempotency_key, None)
+
+        if task.cancelled():
+            return
 
-        exc = future.exception()
+        exc = task.exception()
         if exc is not None:
             self._logger.error(
                 "Asynchronous pipeline execution failed",
@@ -151,7 +220,7 @@ class PipelineExecutor:
             )
             return
 
-        result = future.result()
+        result = task.result()
         self._logger.info(
             "Asynchronous pipeline execution completed",
             extra={
@@ -1,4 +1,4 @@
-import json
+import asyncio
 import time
 from typing import Any, Callable, TypeVar
 
@@ -6,11 +6,30 @@ from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import BaseMessage
 from pydantic import ValidationError
 
+from app.core import json_codec
+
 try:
     import anthropic
 except ModuleNotFoundError:  # pragma: no cover - depends on runtime environment
     anthropic = None
 
+# Resolved once so the retry path does plain isinstance checks. The chat
+# models are built with SDK retries off, so these are the transient failures
+# the SDK would otherwise have retried; APITimeoutError is an APIConnectionError.
+_RETRYABLE_ERRORS: tuple[type[BaseException], ...] = (
+    (
+        TimeoutError,
+        anthropic.APIConnectionError,
+        anthropic.RateLimitError,
+        anthropic.InternalServerError,
+    )
+    if anthropic is not None
+    else (TimeoutError,)
+)
+_STATUS_ERROR: type[BaseException] | None = anthropic.APIStatusError if anthropic is not None else None
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+_NOT_FOUND_ERROR: type[BaseException] | None = anthropic.NotFoundError if anthropic is not None else None
+
 T = TypeVar("T")
 
 
@@ -26,49 +45,120 @@ def run_structured_llm(
     not_found_message: str,
     error_type: type[Exception],
     final_error_prefix: str = "Failed",
+    retry_backoff_seconds: float = 0.5,
+) -> tuple[T, dict[str, Any], int]:
+    start = time.perf_counter()
+    last_error: Exception | None = None
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            result, usage = _parse_response(llm.invoke(messages), parse_output)
+            latency_ms = int((time.perf_counter() - start) * 1000)
+            return result, usage, latency_ms
+        except (json_codec.JSONDecodeError, ValidationError, ValueError) as exc:
+            last_error = exc
+            logger.warning(
+                parse_failure_log_message,
+                extra={"event": parse_failure_event, "attempt": attempt, "error": str(exc)},
+            )
+        except Exception as exc:
+            last_error = exc
+            delay = _retry_delay(
+                exc, attempt, max_retries, retry_backoff_seconds, logger, not_found_message, error_type
+            )
+            if delay:
+                time.sleep(delay)
+
+    raise error_type(f"{final_error_prefix} after {max_retries} attempts: {last_error}")
+
+
+async def arun_structured_llm(
+    llm: BaseChatModel,
+    messages: list[BaseMessage],
+    *,
+    max_retries: int,
+    parse_output: Callable[[dict[str, Any]], T],
+    logger: Any,
+    parse_failure_event: str,
+    parse_failure_log_message: str,
+    not_found_message: str,
+    error_type: type[Exception],
+    final_error_prefix: str = "Failed",
+    retry_backoff_seconds: float = 0.5,
 ) -> tuple[T, dict[str, Any], int]:
+    """`run_structured_llm` on `llm.ainvoke`, so waiting on the model holds no thread."""
     start = time.perf_counter()
     last_error: Exception | None = None
-    usage: dict[str, Any] = {}
 
     for attempt in range(1, max_retries + 1):
         try:
-            response = llm.invoke(messages)
-            usage = extract_usage(response)
-            payload = extract_json_text(response.content)
-            parsed = json.loads(payload)
-            result = parse_output(parsed)
+            result, usage = _parse_response(await llm.ainvoke(messages), parse_output)
             latency_ms = int((time.perf_counter() - start) * 1000)
             return result, usage, latency_ms
-        except (json.JSONDecodeError, ValidationError, ValueError) as exc:
+        except (json_codec.JSONDecodeError, ValidationError, ValueError) as exc:
             last_error = exc
             logger.warning(
                 parse_failure_log_message,
                 extra={"event": parse_failure_event, "attempt": attempt, "error": str(exc)},
             )
         except Exception as exc:
-            if _is_model_not_found_error(exc):
-                raise error_type(not_found_message) from exc
-            raise
+            last_error = exc
+            delay = _retry_delay(
+                exc, attempt, max_retries, retry_backoff_seconds, logger, not_found_message, error_type
+            )
+            if delay:
+                await asyncio.sleep(delay)
 
     raise error_type(f"{final_error_prefix} after {max_retries} attempts: {last_error}")
 
 
+def _parse_response(response: Any, parse_output: Callable[[dict[str, Any]], T]) -> tuple[T, dict[str, Any]]:
+    usage = extract_usage(response)
+    parsed = json_codec.loads(extract_json_text(response.content))
+    return parse_output(parsed), usage
+
+
+def _retry_delay(
+    exc: Exception,
+    attempt: int,
+    max_retries: int,
+    retry_backoff_seconds: float,
+    logger: Any,
+    not_found_message: str,
+    error_type: type[Exception],
+) -> float:
+    """Backoff before the next attempt; re-raises anything that is not transient."""
+    if _is_model_not_found_error(exc):
+        raise error_type(not_found_message) from exc
+    if not _is_retryable_error(exc):
+        raise exc
+    # Timeouts, rate limits and overloaded upstreams are usually transient
+    # rather than a bad request, so they are retried against the same budget.
+    if attempt >= max_retries:
+        logger.warning(
+            "LLM request failed transiently; no attempts left",
+            extra={"event": "llm_retry_exhausted", "attempt": attempt, "error": str(exc)},
+        )
+        return 0.0
+    logger.warning(
+        "LLM request failed transiently; retrying",
+        extra={"event": "llm_retry", "attempt": attempt, "error": str(exc)},
+    )
+    return retry_backoff_seconds * 2 ** (attempt - 1)
+
+
 def extract_json_text(content: Any) -> str:
     if not isinstance(content, str):
         raise ValueError("LLM response content is not a string")
 
-    cleaned = content.strip()
-    if cleaned.startswith("```"):
-        cleaned = cleaned.strip("`")
-        cleaned = cleaned.replace("json", "", 1).strip()
-
-    start = cleaned.find("{")
-    end = cleaned.rfind("}")
-    if start == -1 or end == -1:
+    # The outermost braces already exclude any ``` / ```json fence, so there
+    # is no need to strip it first (which also mangled a leading "json" key).
+    start = content.find("{")
+    end = content.rfind("}")
+    if start == -1 or end < start:
         raise ValueError("No JSON object found in model response")
 
-    return cleaned[start : end + 1]
+    return content[start : end + 1]
 
 
 def extract_usage(response: Any) -> dict[str, Any]:
@@ -83,7 +173,15 @@ def extract_usage(response: Any) -> dict[str, Any]:
     return {}
 
 
+def _is_retryable_error(exc: Exception) -> bool:
+    if isinstance(exc, _RETRYABLE_ERRORS):
+        return True
+    if _STATUS_ERROR is not None and isinstance(exc, _STATUS_ERROR):
+        return exc.status_code in _RETRYABLE_STATUS_CODES or exc.status_code >= 500
+    return False
+
+
 def _is_model_not_found_error(exc: Exception) -> bool:
-    if anthropic is not None and isinstance(exc, anthropic.NotFoundError):
+    if _NOT_FOUND_ERROR is not None and isinstance(exc, _NOT_FOUND_ERROR):
         return "model" in str(exc).lower()
     return exc.__class__.__name__ == "NotFoundError" and "model" in str(exc).lower()
@@ -0,0 +1,41 @@
+"""add status/created_at indexes
+
+Revision ID: 0001_status_created_at_indexes
+Revises:
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_status_created_at_indexes'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tables are created by `init_db()`; `create_all` does not add indexes to
+    # tables that already exist, so this migration backfills them.
+    op.create_index(
+        "ix_processed_contracts_status_created_at",
+        "processed_contracts",
+        ["status", "created_at"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_review_queue_status_created_at",
+        "review_queue",
+        ["status", "created_at"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_review_queue_status_created_at", table_name="review_queue", if_exists=True)
+    op.drop_index(
+        "ix_processed_contracts_status_created_at",
+        table_name="processed_contracts",
+        if_exists=True,
+    )
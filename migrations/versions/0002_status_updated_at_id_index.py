@@ -0,0 +1,32 @@
+"""add status/updated_at/id index for keyset pagination
+
+Revision ID: 0002_status_updated_at_id_index
+Revises: 0001_status_created_at_indexes
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_status_updated_at_id_index'
+down_revision = '0001_status_created_at_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_processed_contracts_status_updated_at_id",
+        "processed_contracts",
+        ["status", "updated_at", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_processed_contracts_status_updated_at_id",
+        table_name="processed_contracts",
+        if_exists=True,
+    )
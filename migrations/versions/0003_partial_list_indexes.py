@@ -0,0 +1,61 @@
+"""replace list-endpoint indexes with partial indexes
+
+Revision ID: 0003_partial_list_indexes
+Revises: 0002_status_updated_at_id_index
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_partial_list_indexes'
+down_revision = '0002_status_updated_at_id_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; outside Postgres the
+    # dialect-specific options are ignored.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_processed_contracts_approved_updated_at_id",
+            "processed_contracts",
+            ["updated_at", "id"],
+            postgresql_where=sa.text("status = 'approved'"),
+            sqlite_where=sa.text("status = 'approved'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_review_queue_pending_created_at_id",
+            "review_queue",
+            ["created_at", "id"],
+            postgresql_where=sa.text("status = 'pending'"),
+            sqlite_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_processed_contracts_status_updated_at_id",
+            table_name="processed_contracts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_processed_contracts_status_updated_at_id",
+        "processed_contracts",
+        ["status", "updated_at", "id"],
+        if_not_exists=True,
+    )
+    op.drop_index("ix_review_queue_pending_created_at_id", table_name="review_queue", if_exists=True)
+    op.drop_index(
+        "ix_processed_contracts_approved_updated_at_id",
+        table_name="processed_contracts",
+        if_exists=True,
+    )
@@ -61,3 +61,11 @@ def test_validate_required_allows_weak_values_in_development() -> None:
         environment="development",
     )
     settings.validate_required()
+
+
+def test_resolved_properties_are_computed_once() -> None:
+    settings = _settings(allowed_origins_raw=" http://a.test , ,http://b.test ", extraction_model=" claude-x ")
+    assert settings.allowed_origins == ["http://a.test", "http://b.test"]
+    assert settings.allowed_origins is settings.allowed_origins
+    assert settings.resolved_extraction_model == "claude-x"
+    assert settings.resolved_validation_model == "claude-test"
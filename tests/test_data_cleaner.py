@@ -1,3 +1,8 @@
+import re
+from unittest.mock import Mock
+
+import pytest
+
 from app.core.schemas import ContractExtraction
 from app.processing.data_cleaner import clean_payload_for_model
 
@@ -37,3 +42,47 @@ def test_clean_payload_for_model_handles_magnitude_and_nullish_values() -> None:
     assert cleaned["contract_end_date"] == ""
     assert cleaned["total_value"] == 1_500_000.0
     assert cleaned["confidence_score"] == 0.0
+
+
+def test_clean_payload_for_model_plain_values_match_slow_path() -> None:
+    payload = {
+        "vendor_name": "Acme\tCorp",
+        "contract_start_date": "2026-03-01",
+        "contract_end_date": "",
+        "total_value": "-1250.50",
+        "confidence_score": 0.8,
+    }
+
+    cleaned = clean_payload_for_model(payload, ContractExtraction)
+    assert cleaned["vendor_name"] == "Acme Corp"
+    assert cleaned["total_value"] == -1250.5
+    assert cleaned["confidence_score"] == 0.8
+
+
+def test_clean_payload_for_model_resolves_numeric_date_layouts() -> None:
+    payload = {
+        "contract_start_date": "04/03/2026",
+        "contract_end_date": "31/03/2027",
+        "vendor_name": "02/30/2026",
+    }
+
+    cleaned = clean_payload_for_model(payload, ContractExtraction)
+    assert cleaned["contract_start_date"] == "2026-04-03"
+    assert cleaned["contract_end_date"] == "2027-03-31"
+    assert cleaned["vendor_name"] == "02/30/2026"
+
+
+@pytest.mark.parametrize("name", ["compile", "search", "sub", "match", "fullmatch"])
+def test_clean_payload_for_model_uses_precompiled_patterns(monkeypatch, name: str) -> None:
+    spy = Mock(wraps=getattr(re, name))
+    monkeypatch.setattr(re, name, spy)
+    payload = {
+        "vendor_name": "  ACME   Holdings  ",
+        "contract_start_date": "March 1st, 2026",
+        "contract_end_date": "31/03/2027",
+        "total_value": "1.5 million dollars",
+        "confidence_score": "0.95",
+    }
+
+    clean_payload_for_model(payload, ContractExtraction)
+    assert spy.call_count == 0
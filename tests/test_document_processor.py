@@ -0,0 +1,99 @@
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.core.schemas import DocumentMetadata
+from app.processing import document_processor
+from app.processing.document_processor import DocumentProcessor, fitz
+
+
+def test_normalize_text_collapses_whitespace_runs() -> None:
+    text = "  Vendor:\t \tACME\r\n\n\n\nTerm:  12\fmonths  "
+    assert DocumentProcessor._normalize_text(text) == "Vendor: ACME \n\nTerm: 12 months"
+
+
+def test_normalize_text_applies_nfkc_to_non_ascii() -> None:
+    assert DocumentProcessor._normalize_text("ﬁnal price") == "final price"
+
+
+def _write_pdf(path: Path, pages: list[str]) -> None:
+    with fitz.open() as doc:
+        for text in pages:
+            page = doc.new_page()
+            page.insert_text((72, 72), text)
+        doc.save(path)
+
+
+def _metadata() -> DocumentMetadata:
+    return DocumentMetadata(
+        sender="sender@test.com",
+        subject="subject",
+        filename="contract.pdf",
+        received_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_extract_document_text_joins_pages_in_order(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "contract.pdf"
+    _write_pdf(pdf_path, ["Vendor: ACME", "Term: 12 months"])
+
+    document = DocumentProcessor().extract_document_text(pdf_path, _metadata())
+
+    assert document.raw_text == "Vendor: ACME\n\nTerm: 12 months"
+    assert document.metadata["source_file"] == str(pdf_path)
+
+
+def test_extract_document_text_reads_in_memory_bytes(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "contract.pdf"
+    _write_pdf(pdf_path, ["Vendor: ACME", "Term: 12 months"])
+    pdf_bytes = pdf_path.read_bytes()
+    pdf_path.unlink()
+
+    document = DocumentProcessor().extract_document_text("upload.pdf", _metadata(), pdf_bytes=pdf_bytes)
+
+    assert document.raw_text == "Vendor: ACME\n\nTerm: 12 months"
+
+
+def test_extract_document_text_parallel_matches_serial(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "long.pdf"
+    _write_pdf(pdf_path, [f"Section {index}" for index in range(5)])
+
+    serial = DocumentProcessor().extract_document_text(pdf_path, _metadata())
+    with DocumentProcessor(parallel_page_threshold=2, max_page_workers=2) as processor:
+        parallel = processor.extract_document_text(pdf_path, _metadata())
+        pool = processor._page_pool
+        # The second document reuses the same worker pool.
+        from_bytes = processor.extract_document_text(
+            "upload.pdf", _metadata(), pdf_bytes=pdf_path.read_bytes()
+        )
+        assert processor._page_pool is pool
+    assert processor._page_pool is None
+
+    assert parallel.raw_text == serial.raw_text
+    assert from_bytes.raw_text == serial.raw_text
+
+
+def test_extract_document_text_falls_back_to_serial_on_broken_pool(tmp_path: Path, monkeypatch) -> None:
+    pdf_path = tmp_path / "long.pdf"
+    _write_pdf(pdf_path, [f"Section {index}" for index in range(5)])
+
+    def _broken(*args, **kwargs):  # noqa: ANN002, ANN003
+        raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(document_processor, "extract_pdf_text_parallel", _broken)
+    with DocumentProcessor(parallel_page_threshold=2, max_page_workers=2) as processor:
+        document = processor.extract_document_text(pdf_path, _metadata())
+        # The broken pool is dropped; the next long document builds a new one.
+        assert processor._page_pool is None
+
+    assert document.raw_text == DocumentProcessor().extract_document_text(pdf_path, _metadata()).raw_text
+
+
+def test_document_processor_creates_no_pool_until_needed(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "contract.pdf"
+    _write_pdf(pdf_path, ["Vendor: ACME"])
+
+    processor = DocumentProcessor(parallel_page_threshold=2, max_page_workers=2)
+    processor.extract_document_text(pdf_path, _metadata())
+
+    assert processor._page_pool is None
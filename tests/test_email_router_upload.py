@@ -1,34 +1,54 @@
 from io import BytesIO
-from pathlib import Path
+from tempfile import SpooledTemporaryFile
 
 import pytest
 from fastapi import HTTPException, UploadFile
 
-from app.routers.email_router import _save_pdf_attachment
+from app.routers.email_router import _read_pdf_attachment
 
 
-def test_save_pdf_attachment_rejects_non_pdf_signature(tmp_path: Path) -> None:
+def test_read_pdf_attachment_rejects_non_pdf_signature() -> None:
     upload = UploadFile(filename="test.pdf", file=BytesIO(b"NOTPDF"))
     with pytest.raises(HTTPException) as exc:
-        _save_pdf_attachment(
+        _read_pdf_attachment(
             attachment=upload,
-            target_path=tmp_path / "contract.pdf",
             max_upload_size_bytes=1024,
         )
     assert exc.value.status_code == 400
 
 
-def test_save_pdf_attachment_enforces_size_limit(tmp_path: Path) -> None:
-    payload = b"%PDF-" + (b"a" * 2000)
-    upload = UploadFile(filename="large.pdf", file=BytesIO(payload))
-    target = tmp_path / "large.pdf"
+def test_read_pdf_attachment_enforces_size_limit() -> None:
+    payload = b"%PDF-" + (b"a" * 20000)
+    # UploadFile spools to a SpooledTemporaryFile in production.
+    spool = SpooledTemporaryFile(max_size=1024)
+    spool.write(payload)
+    spool.seek(0)
+    upload = UploadFile(filename="large.pdf", file=spool)
 
     with pytest.raises(HTTPException) as exc:
-        _save_pdf_attachment(
+        _read_pdf_attachment(
             attachment=upload,
-            target_path=target,
             max_upload_size_bytes=1024,
         )
 
     assert exc.value.status_code == 413
-    assert not target.exists()
+    # The reader stops one byte past the limit instead of draining the upload.
+    assert spool.tell() == 1025
+    spool.close()
+
+
+def test_read_pdf_attachment_returns_full_payload() -> None:
+    payload = b"%PDF-" + (b"a" * 2000) + b"\n%%EOF\n"
+    upload = UploadFile(filename="contract.pdf", file=BytesIO(payload))
+
+    assert _read_pdf_attachment(attachment=upload, max_upload_size_bytes=4096) == payload
+
+
+def test_read_pdf_attachment_rejects_truncated_pdf() -> None:
+    payload = b"%PDF-" + (b"a" * 20) + b"\n%%EOF\n" + (b"a" * 2000)
+    upload = UploadFile(filename="truncated.pdf", file=BytesIO(payload))
+
+    with pytest.raises(HTTPException) as exc:
+        _read_pdf_attachment(attachment=upload, max_upload_size_bytes=4096)
+
+    assert exc.value.status_code == 400
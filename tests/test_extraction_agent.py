@@ -1,30 +1,183 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import anthropic
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.agents import extraction_agent
 from app.agents.extraction_agent import ExtractionAgent
+from app.core.schemas import DocumentText
+from app.db.models import Base
+from app.services.extraction_cache import ExtractionCache
+from app.services.structured_llm import extract_json_text
+
 
+@pytest.fixture(scope="module")
+def offline_agent() -> ExtractionAgent:
+    # The text helpers never touch the LLM, so one agent serves every test.
+    return ExtractionAgent(llm=object(), max_retries=1, max_input_chars=4000)
+
+
+@pytest.fixture(scope="module")
+def long_contract_text() -> str:
+    return "Vendor Agreement\n\n" + (
+        "This section describes the vendor name, term and total value in USD 5000.\n\n" * 600
+    )
 
-def test_bounded_input_text_keeps_short_text() -> None:
-    agent = ExtractionAgent(llm=object(), max_retries=1, max_input_chars=4000)
+
+def test_bounded_input_text_keeps_short_text(offline_agent: ExtractionAgent) -> None:
     text = "Short contract text"
-    assert agent._build_bounded_input_text(text) == text
+    assert offline_agent._build_bounded_input_text(text) == text
 
 
-def test_bounded_input_text_truncates_long_text() -> None:
-    agent = ExtractionAgent(llm=object(), max_retries=1, max_input_chars=4000)
-    long_text = (
-        "Vendor Agreement\n\n"
-        + ("This section describes the vendor name, term and total value in USD 5000.\n\n" * 600)
+def test_truncation_markers_fit_their_reserve() -> None:
+    assert (
+        len(extraction_agent._HEAD_MARKER) + len(extraction_agent._TAIL_MARKER)
+        <= extraction_agent._MARKER_RESERVE_CHARS
     )
-    bounded = agent._build_bounded_input_text(long_text)
+
+
+def test_bounded_input_text_truncates_long_text(
+    offline_agent: ExtractionAgent,
+    long_contract_text: str,
+) -> None:
+    bounded = offline_agent._build_bounded_input_text(long_contract_text)
     assert len(bounded) <= 4000
     assert "TRUNCATED FOR TOKEN LIMIT" in bounded
 
 
-def test_normalize_payload_derives_confidence_from_cleaned_payload() -> None:
+def test_parse_output_derives_confidence_from_cleaned_payload() -> None:
     payload = {
         "vendor_name": "ACME Inc",
         "contract_start_date": "2026-01-01",
         "contract_end_date": "2027-01-01",
         "total_value": 70000.0,
+        "confidence_score": 0.1,
     }
-    normalized = ExtractionAgent._normalize_payload(payload)
-    assert normalized["total_value"] == 70000.0
-    assert normalized["confidence_score"] == 1.0
+    extraction = ExtractionAgent._parse_output(payload)
+    assert extraction.total_value == 70000.0
+    assert extraction.confidence_score == 1.0
+
+
+def test_parse_output_defaults_missing_fields() -> None:
+    extraction = ExtractionAgent._parse_output({"vendor_name": "ACME Inc", "contract_end_date": None})
+    assert extraction.contract_start_date == ""
+    assert extraction.contract_end_date == ""
+    assert extraction.total_value == 0.0
+    assert extraction.confidence_score == 0.25
+
+
+class _CountingLLM:
+    model = "claude-test"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def invoke(self, messages):  # noqa: ANN001
+        _ = messages
+        self.calls += 1
+        return SimpleNamespace(
+            content=(
+                '{"vendor_name": "ACME Inc", "contract_start_date": "2026-01-01", '
+                '"contract_end_date": "2027-01-01", "total_value": 70000}'
+            ),
+            usage_metadata={"input_tokens": 10, "output_tokens": 5},
+        )
+
+
+class _TimingOutOnceLLM(_CountingLLM):
+    def invoke(self, messages):  # noqa: ANN001
+        if self.calls == 0:
+            self.calls += 1
+            raise TimeoutError("request timed out")
+        return super().invoke(messages)
+
+
+def test_extract_retries_after_llm_timeout() -> None:
+    llm = _TimingOutOnceLLM()
+    agent = ExtractionAgent(llm=llm, max_retries=2)
+
+    extraction, _, _ = agent.extract(DocumentText(raw_text="Contract", metadata={}))
+
+    assert extraction.vendor_name == "ACME Inc"
+    assert llm.calls == 2
+
+
+class _RateLimitedOnceLLM(_CountingLLM):
+    def invoke(self, messages):  # noqa: ANN001
+        if self.calls == 0:
+            self.calls += 1
+            request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+            raise anthropic.RateLimitError(
+                "rate limited", response=httpx.Response(429, request=request), body=None
+            )
+        return super().invoke(messages)
+
+
+def test_extract_retries_after_rate_limit() -> None:
+    llm = _RateLimitedOnceLLM()
+    agent = ExtractionAgent(llm=llm, max_retries=2)
+
+    with patch("app.services.structured_llm.time.sleep") as sleep:
+        extraction, _, _ = agent.extract(DocumentText(raw_text="Contract", metadata={}))
+
+    assert extraction.vendor_name == "ACME Inc"
+    assert llm.calls == 2
+    sleep.assert_called_once()
+
+
+def test_extract_reuses_cached_result_for_identical_text() -> None:
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+    llm = _CountingLLM()
+    agent = ExtractionAgent(llm=llm, max_retries=1, cache=ExtractionCache(SessionLocal))
+    document = DocumentText(raw_text="Vendor: ACME Inc", metadata={})
+
+    first, first_usage, _ = agent.extract(document)
+    second, second_usage, _ = agent.extract(document)
+
+    assert llm.calls == 1
+    assert first == second
+    assert first_usage == {"input_tokens": 10, "output_tokens": 5}
+    assert second_usage == {"cache_hit": True}
+
+
+def test_select_keyword_sections_matches_whole_words_only(offline_agent: ExtractionAgent) -> None:
+    text = "Market trends overview\n\nThe agreement term is 12 months\n\nUnrelated notes\n\nTotal: 5000"
+    assert offline_agent._select_keyword_sections(text, 1000) == (
+        "The agreement term is 12 months\n\nTotal: 5000"
+    )
+
+
+def test_keyword_sections_use_unicode_word_boundaries(offline_agent: ExtractionAgent) -> None:
+    # "İ" lowercases to two characters, which forces the regex path.
+    text = "İ äend Vendorß\n\nThe vendor agreement"
+    assert len(text.lower()) != len(text)
+
+    assert list(offline_agent._iter_keyword_sections(text)) == [(16, len(text), 2)]
+
+
+def test_select_keyword_sections_prefers_dense_sections_in_document_order(
+    offline_agent: ExtractionAgent,
+) -> None:
+    sparse = "The vendor will deliver goods as described in the attached schedule of work items"
+    dense = "Contract total value: USD 5000"
+    text = f"{sparse}\n\n{dense}\n\nTerm ends 2027"
+    assert offline_agent._select_keyword_sections(text, 50) == f"{dense}\n\nTerm ends 2027"
+
+
+def test_bounded_input_text_strips_short_text_with_surrounding_whitespace(
+    offline_agent: ExtractionAgent,
+) -> None:
+    assert offline_agent._build_bounded_input_text("  Short contract text\n") == "Short contract text"
+
+
+def test_extract_json_text_keeps_leading_json_key_inside_fence() -> None:
+    content = '```json\n{"json": "value", "nested": {"a": 1}}\n```'
+    assert extract_json_text(content) == '{"json": "value", "nested": {"a": 1}}'
+    assert extract_json_text('```\n{"json": 1}\n```') == '{"json": 1}'
@@ -1,82 +1,88 @@
-from pathlib import Path
-from tempfile import NamedTemporaryFile
+from unittest.mock import Mock, create_autospec
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
+from app.agents.extraction_agent import ExtractionAgent
+from app.agents.validation_agent import ValidationAgent
 from app.core.errors import DocumentProcessingError
-from app.core.schemas import ContractExtraction, RetrievedPolicy, ValidationResult
-from app.db.models import Base, ProcessedContract, ReviewQueue
+from app.core.schemas import ContractExtraction, DocumentText, RetrievedPolicy, ValidationResult
+from app.db.models import ProcessedContract, ReviewQueue
 from app.orchestration.orchestrator import ContractOrchestrator
+from app.rag.retriever import PolicyRetriever
 
 
 class _FailingDocumentProcessor:
-    def extract_document_text(self, file_path, metadata):  # noqa: ANN001
-        _ = file_path, metadata
+    def extract_document_text(self, file_path, metadata, pdf_bytes=None):  # noqa: ANN001
+        _ = file_path, metadata, pdf_bytes
         raise DocumentProcessingError("PDF did not contain extractable text")
 
 
-class _DummyExtractionAgent:
-    def extract(self, document):  # noqa: ANN001
-        _ = document
-        return (
-            ContractExtraction(
-                vendor_name="Vendor",
-                contract_start_date="2026-01-01",
-                contract_end_date="2027-01-01",
-                total_value=1000.0,
-                confidence_score=1.0,
-            ),
-            {},
-            1,
-        )
-
-
-class _DummyPolicyRetriever:
-    def retrieve_relevant_policies(self, contract_json):  # noqa: ANN001
-        _ = contract_json
-        return [RetrievedPolicy(source="test", content="USD 500000")]
-
-
-class _DummyValidationAgent:
-    def validate(self, contract, policies):  # noqa: ANN001
-        _ = contract, policies
-        return (
-            ValidationResult(
-                policy_violations=[],
-                risk_level="low",
-                requires_human_review=False,
-                rationale="ok",
-            ),
-            {},
-            1,
-        )
-
-
-def test_orchestrator_routes_document_processing_error_to_review_queue() -> None:
-    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
-    Base.metadata.create_all(bind=engine)
-    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
-
+class _DummyDocumentProcessor:
+    def extract_document_text(self, file_path, metadata, pdf_bytes=None):  # noqa: ANN001
+        _ = file_path, pdf_bytes
+        return DocumentText(raw_text="Vendor contract", metadata=metadata.model_dump(mode="json"))
+
+
+_EXTRACTION_RESULT = (
+    ContractExtraction.model_construct(
+        vendor_name="Vendor",
+        contract_start_date="2026-01-01",
+        contract_end_date="2027-01-01",
+        total_value=1000.0,
+        confidence_score=1.0,
+    ),
+    {},
+    1,
+)
+_POLICIES = [RetrievedPolicy(source="test", content="USD 500000")]
+_VALIDATION_RESULT = (
+    ValidationResult.model_construct(
+        policy_violations=[],
+        risk_level="low",
+        requires_human_review=False,
+        rationale="ok",
+    ),
+    {},
+    1,
+)
+
+
+def _orchestrator(
+    document_processor: object, session_factory: sessionmaker[Session]
+) -> tuple[ContractOrchestrator, Mock]:
+    # Autospec checks call signatures against the real agents, and the async
+    # aextract becomes an AsyncMock.
+    extraction_agent = create_autospec(ExtractionAgent, instance=True)
+    extraction_agent.aextract.return_value = _EXTRACTION_RESULT
+    policy_retriever = create_autospec(PolicyRetriever, instance=True)
+    policy_retriever.retrieve_relevant_policies.return_value = _POLICIES
+    validation_agent = create_autospec(ValidationAgent, instance=True)
+    validation_agent.missing_required_fields.return_value = []
+    validation_agent.validate.return_value = _VALIDATION_RESULT
     orchestrator = ContractOrchestrator(
-        document_processor=_FailingDocumentProcessor(),
-        extraction_agent=_DummyExtractionAgent(),
-        policy_retriever=_DummyPolicyRetriever(),
-        validation_agent=_DummyValidationAgent(),
-        session_factory=SessionLocal,
+        document_processor=document_processor,
+        extraction_agent=extraction_agent,
+        policy_retriever=policy_retriever,
+        validation_agent=validation_agent,
+        session_factory=session_factory,
     )
+    return orchestrator, extraction_agent
+
 
-    with NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-        tmp.write(b"%PDF- demo")
-        file_path = tmp.name
+def test_orchestrator_routes_document_processing_error_to_review_queue(
+    session_factory: sessionmaker[Session],
+) -> None:
+    orchestrator, extraction_agent = _orchestrator(_FailingDocumentProcessor(), session_factory)
 
-    result = orchestrator.run("sender@test.com", "subject", file_path)
+    # The processors never open the file, and cleanup tolerates a missing one.
+    result = orchestrator.run("sender@test.com", "subject", "/virtual/demo.pdf")
 
     assert result["routing_decision"].route == "review_queue"
     assert result["validation_result"].requires_human_review is True
+    extraction_agent.aextract.assert_not_awaited()
     assert isinstance(result["contract_id"], int)
 
-    with SessionLocal() as session:
+    with session_factory() as session:
         contract = session.get(ProcessedContract, result["contract_id"])
         assert contract is not None
         assert contract.route_decision == "review_queue"
@@ -86,4 +92,18 @@ def test_orchestrator_routes_document_processing_error_to_review_queue() -> None
         assert queue_item is not None
         assert queue_item.status == "pending"
 
-    Path(file_path).unlink(missing_ok=True)
+
+def test_orchestrator_persists_auto_approved_contract(session_factory: sessionmaker[Session]) -> None:
+    orchestrator, extraction_agent = _orchestrator(_DummyDocumentProcessor(), session_factory)
+
+    result = orchestrator.run("sender@test.com", "subject", "/virtual/demo.pdf")
+
+    assert result["routing_decision"].route == "auto_approve"
+    assert result["retrieved_policies"] == _POLICIES
+    extraction_agent.aextract.assert_awaited_once()
+    assert result["missing_required_fields"] == []
+
+    with session_factory() as session:
+        contract = session.get(ProcessedContract, result["contract_id"])
+        assert contract is not None
+        assert contract.status == "approved"
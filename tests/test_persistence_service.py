@@ -0,0 +1,53 @@
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.schemas import ContractExtraction, RoutingDecision, ValidationResult
+from app.db.models import Base, ProcessedContract, ProcessingLog, ReviewQueue
+from app.services.persistence_service import ContractPersistenceService
+
+
+def test_persist_success_writes_contract_queue_and_logs_in_three_inserts() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+    state = {
+        "sender": "sender@test.com",
+        "subject": "contract",
+        "file_path": "contract.pdf",
+        "extracted_contract": ContractExtraction(
+            vendor_name="Vendor",
+            contract_start_date="2026-01-01",
+            contract_end_date="2027-01-01",
+            total_value=1000.0,
+            confidence_score=0.5,
+        ),
+        "validation_result": ValidationResult(
+            policy_violations=["late payment"],
+            risk_level="high",
+            requires_human_review=True,
+            rationale="needs review",
+        ),
+        "routing_decision": RoutingDecision(route="review_queue", reasons=["risk", "threshold"]),
+    }
+
+    inserts: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: inserts.append(args[2]) if args[2].startswith("INSERT") else None,
+    )
+    contract_id = ContractPersistenceService(SessionLocal).persist_success(state)
+
+    with SessionLocal() as db:
+        contract = db.get(ProcessedContract, contract_id)
+        review = db.execute(select(ReviewQueue)).scalar_one()
+        logs = db.execute(select(ProcessingLog.stage, ProcessingLog.payload).order_by(ProcessingLog.id)).all()
+
+    assert len(inserts) == 3
+    assert contract.status == "pending_review"
+    assert contract.validation_payload["policy_violations"] == ["late payment"]
+    assert review.contract_id == contract_id
+    assert review.reason == "risk; threshold"
+    assert [stage for stage, _ in logs] == ["extract", "validate", "route"]
+    assert logs[-1].payload == {"route": "review_queue"}
+    assert contract.routing_payload["reasons"] == ["risk", "threshold"]
@@ -1,21 +1,25 @@
 import asyncio
-import threading
-import time
 
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import Base
+from app.services.idempotency_store import DatabaseIdempotencyStore
 from app.services.pipeline_executor import PipelineExecutor
 
 
 class _DummyOrchestrator:
     def __init__(self) -> None:
         self.calls = 0
-        self._lock = threading.Lock()
-
-    def run(self, sender: str, subject: str, file_path: str) -> dict:
-        _ = sender, subject, file_path
-        with self._lock:
-            self.calls += 1
-            current = self.calls
-        time.sleep(0.1)
+        # Runs stay in flight until the test releases them.
+        self.release = asyncio.Event()
+
+    async def arun(self, sender: str, subject: str, file_path: str, pdf_bytes: bytes | None = None) -> dict:
+        _ = sender, subject, file_path, pdf_bytes
+        self.calls += 1
+        current = self.calls
+        await self.release.wait()
         return {"contract_id": current}
 
 
@@ -45,11 +49,163 @@ def test_pipeline_executor_reuses_inflight_idempotent_request() -> None:
                 idempotency_key="same-key",
             )
         )
+        # One loop pass lets both submissions register before the run finishes.
+        await asyncio.sleep(0)
+        orchestrator.release.set()
         first, second = await asyncio.gather(task_one, task_two)
+        await executor.shutdown()
         return first.request_id, second.request_id
 
     req_one, req_two = asyncio.run(_run())
-    executor.shutdown()
 
     assert req_one == req_two
     assert orchestrator.calls == 1
+
+
+def test_pipeline_executor_runs_distinct_keys_concurrently() -> None:
+    orchestrator = _DummyOrchestrator()
+    executor = PipelineExecutor(
+        orchestrator=orchestrator,
+        max_workers=2,
+        wait_timeout_seconds=2,
+        idempotency_enabled=True,
+    )
+
+    async def _run() -> tuple[int, str, str]:
+        task_one = asyncio.create_task(
+            executor.submit_and_wait(
+                sender="a", subject="b", file_path="/tmp/c.pdf", idempotency_key="key-one"
+            )
+        )
+        task_two = asyncio.create_task(
+            executor.submit_and_wait(
+                sender="d", subject="e", file_path="/tmp/f.pdf", idempotency_key="key-two"
+            )
+        )
+        # Both runs must start before either finishes; a shared lock would block the second.
+        for _ in range(5):
+            await asyncio.sleep(0)
+        started = orchestrator.calls
+        orchestrator.release.set()
+        first, second = await asyncio.gather(task_one, task_two)
+        await executor.shutdown()
+        return started, first.request_id, second.request_id
+
+    started, req_one, req_two = asyncio.run(_run())
+
+    assert started == 2
+    assert req_one != req_two
+    assert orchestrator.calls == 2
+
+
+def test_pipeline_executor_survives_cancelled_idempotent_caller() -> None:
+    orchestrator = _DummyOrchestrator()
+    executor = PipelineExecutor(
+        orchestrator=orchestrator,
+        max_workers=1,
+        wait_timeout_seconds=2,
+        idempotency_enabled=True,
+    )
+
+    async def _run():
+        first = asyncio.create_task(
+            executor.submit_and_wait(
+                sender="a", subject="b", file_path="/tmp/c.pdf", idempotency_key="same-key"
+            )
+        )
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        second = asyncio.create_task(
+            executor.submit_and_wait(
+                sender="a", subject="b", file_path="/tmp/c.pdf", idempotency_key="same-key"
+            )
+        )
+        await asyncio.sleep(0)
+        orchestrator.release.set()
+        outcome = await second
+        await executor.shutdown()
+        return first.cancelled(), outcome
+
+    first_cancelled, outcome = asyncio.run(_run())
+
+    assert first_cancelled is True
+    assert outcome.completed is True
+    assert outcome.result == {"contract_id": 1}
+    assert orchestrator.calls == 1
+
+
+def test_pipeline_executor_keeps_running_after_sync_timeout() -> None:
+    orchestrator = _DummyOrchestrator()
+    executor = PipelineExecutor(
+        orchestrator=orchestrator,
+        max_workers=1,
+        wait_timeout_seconds=1,
+    )
+    executor._wait_timeout_seconds = 0.01
+
+    async def _run():
+        outcome = await executor.submit_and_wait(sender="a", subject="b", file_path="/tmp/c.pdf")
+        orchestrator.release.set()
+        await executor.shutdown()
+        return outcome
+
+    outcome = asyncio.run(_run())
+
+    assert outcome.completed is False
+    assert orchestrator.calls == 1
+
+
+def test_database_idempotency_store_claims_once_until_released() -> None:
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    store = DatabaseIdempotencyStore(sessionmaker(bind=engine))
+
+    assert store.claim("key", "first") is None
+    assert store.claim("key", "second") == "first"
+    store.release("key", "second")
+    assert store.claim("key", "third") == "first"
+    store.release("key", "first")
+    assert store.claim("key", "third") is None
+
+
+def test_pipeline_executor_defers_key_claimed_by_another_process() -> None:
+    orchestrator = _DummyOrchestrator()
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    store = DatabaseIdempotencyStore(sessionmaker(bind=engine))
+    store.claim("shared-key", "other-worker")
+    local = PipelineExecutor(
+        orchestrator=orchestrator,
+        max_workers=1,
+        wait_timeout_seconds=2,
+        idempotency_store=store,
+    )
+
+    async def _run():
+        orchestrator.release.set()
+        deferred = await local.submit_and_wait(
+            sender="a", subject="b", file_path="/tmp/c.pdf", idempotency_key="shared-key"
+        )
+        store.release("shared-key", "other-worker")
+        completed = await local.submit_and_wait(
+            sender="a", subject="b", file_path="/tmp/c.pdf", idempotency_key="shared-key"
+        )
+        await local.shutdown()
+        after_release = store.claim("shared-key", "next")
+        return deferred, completed, after_release
+
+    deferred, completed, after_release = asyncio.run(_run())
+
+    assert (deferred.completed, deferred.request_id) == (False, "other-worker")
+    assert completed.completed is True
+    assert orchestrator.calls == 1
+    assert after_release is None
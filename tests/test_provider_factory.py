@@ -0,0 +1,16 @@
+from app.core.config import Settings
+from app.providers import build_chat_model
+
+
+def test_build_chat_model_reuses_client_per_configuration() -> None:
+    settings = Settings(anthropic_api_key="test-anthropic", llm_timeout_seconds=30)
+
+    first = build_chat_model(settings, model_name="claude-test")
+    assert build_chat_model(settings, model_name="claude-test") is first
+    assert build_chat_model(settings, model_name="claude-other") is not first
+
+
+def test_build_chat_model_leaves_retries_to_structured_llm() -> None:
+    settings = Settings(anthropic_api_key="test-anthropic", llm_timeout_seconds=30)
+
+    assert build_chat_model(settings, model_name="claude-retries").max_retries == 0
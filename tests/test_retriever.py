@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import Settings
+from app.core.schemas import ContractExtraction
+from app.rag.retriever import PolicyRetriever
+
+
+class _CountingEmbeddings:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls += 1
+        return [float(len(text))]
+
+
+class _FakeVectorStore:
+    def __init__(self) -> None:
+        self.vectors: list[list[float]] = []
+
+    def similarity_search_by_vector(self, embedding, k):  # noqa: ANN001
+        self.vectors.append(embedding)
+        return [SimpleNamespace(page_content="Policy", metadata={"source": "policy.md"})][:k]
+
+
+def _contract(vendor_name: str) -> ContractExtraction:
+    return ContractExtraction(
+        vendor_name=vendor_name,
+        contract_start_date="2026-01-01",
+        contract_end_date="2027-01-01",
+        total_value=1000.0,
+        confidence_score=1.0,
+    )
+
+
+def test_retriever_reuses_cached_query_embeddings() -> None:
+    embeddings = _CountingEmbeddings()
+    retriever = PolicyRetriever(Settings(), embeddings=embeddings, embedding_cache_size=1)
+    vector_store = _FakeVectorStore()
+    retriever._vector_store = vector_store
+
+    first = retriever.retrieve_relevant_policies(_contract("ACME"))
+    retriever.retrieve_relevant_policies(_contract("ACME"))
+    assert embeddings.calls == 1
+    assert first[0].source == "policy.md"
+
+    retriever.retrieve_relevant_policies(_contract("Globex"))
+    retriever.retrieve_relevant_policies(_contract("ACME"))
+    assert embeddings.calls == 3
+    assert len(vector_store.vectors) == 4
+
+
+def test_retriever_requires_initialize_before_retrieval() -> None:
+    retriever = PolicyRetriever(Settings(), embeddings=_CountingEmbeddings())
+
+    with pytest.raises(RuntimeError, match="initialize"):
+        retriever.retrieve_relevant_policies(_contract("ACME"))
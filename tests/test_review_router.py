@@ -0,0 +1,161 @@
+from datetime import datetime, timedelta, timezone
+from functools import partial
+import json
+
+from fastapi import HTTPException
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, ProcessedContract, ReviewQueue
+from app.routers.review_router import (
+    approve_review,
+    get_approved_contracts,
+    get_review_queue,
+    reject_review,
+)
+
+
+def _contract(index: int, updated_at: datetime) -> ProcessedContract:
+    return ProcessedContract(
+        sender="sender@test.com",
+        subject=f"contract {index}",
+        file_path=f"{index}.pdf",
+        vendor_name=f"Vendor {index}",
+        contract_start_date="2026-01-01",
+        contract_end_date="2027-01-01",
+        total_value=1000.0,
+        payment_terms_days=0,
+        auto_renewal=False,
+        termination_notice_days=0,
+        governing_law="",
+        extraction_confidence_score=1.0,
+        extracted_payload={},
+        validation_payload={"risk_level": "low"},
+        routing_payload={},
+        route_decision="auto_approve",
+        status="approved",
+        updated_at=updated_at,
+    )
+
+
+def test_approved_contracts_keyset_pages_cover_every_row_once() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    with SessionLocal() as db:
+        # Two rows share a timestamp so the id tie-breaker is exercised.
+        db.add_all(
+            [_contract(index, base + timedelta(minutes=index // 2)) for index in range(5)]
+        )
+        db.commit()
+
+        seen: list[int] = []
+        cursor = None
+        while True:
+            page = json.loads(
+                get_approved_contracts(limit=3, offset=0, cursor=cursor, if_none_match=None, db=db).body
+            )
+            seen.extend(item["contract_id"] for item in page["items"])
+            if not page["has_more"]:
+                break
+            cursor = page["next_cursor"]
+
+        legacy = json.loads(
+            get_approved_contracts(limit=5, offset=0, cursor=None, if_none_match=None, db=db).body
+        )
+
+    assert seen == [item["contract_id"] for item in legacy["items"]]
+    assert sorted(seen) == [1, 2, 3, 4, 5]
+    assert legacy["next_cursor"] is None
+    assert legacy["count"] == 5
+    assert legacy["items"][0]["risk_level"] == "low"
+    assert legacy["items"][0]["policy_violations"] == []
+    assert legacy["items"][0]["approved_at"] == (base + timedelta(minutes=2)).replace(tzinfo=None).isoformat()
+
+
+def test_approved_contracts_returns_304_until_an_approval_changes_the_etag() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    with SessionLocal() as db:
+        _page = partial(get_approved_contracts, limit=5, offset=0, cursor=None, db=db)
+
+        db.add(_contract(0, base))
+        db.commit()
+        etag = _page(if_none_match=None).headers["ETag"]
+        not_modified = _page(if_none_match=etag)
+        db.add(_contract(1, base + timedelta(hours=1)))
+        db.commit()
+        changed = _page(if_none_match=etag)
+
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+    assert not_modified.headers["Cache-Control"] == "private, max-age=5"
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_review_queue_selects_narrow_rows_in_one_query_and_pages_by_cursor() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    with SessionLocal() as db:
+        for index in range(3):
+            contract = _contract(index, base)
+            contract.status = "pending_review"
+            contract.validation_payload = {"risk_level": "high", "policy_violations": [f"rule {index}"]}
+            contract.review_item = ReviewQueue(status="pending", reason="threshold", created_at=base)
+            db.add(contract)
+        db.commit()
+        db.expunge_all()
+
+        statements: list[str] = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        first_response = get_review_queue(limit=2, offset=0, cursor=None, db=db)
+        second_response = get_review_queue(
+            limit=2, offset=0, cursor=first_response.headers["X-Next-Cursor"], db=db
+        )
+        first, second = json.loads(first_response.body), json.loads(second_response.body)
+
+    assert [item["review_id"] for item in first + second] == [1, 2, 3]
+    assert first[0]["vendor_name"] == "Vendor 0"
+    assert first[0]["risk"] == "high"
+    assert first[0]["violations"] == ["rule 0"]
+    assert "X-Next-Cursor" not in second_response.headers
+    assert len(statements) == 2
+    assert all("extracted_payload" not in statement for statement in statements)
+
+
+def test_resolving_review_updates_both_rows_and_rejects_second_resolution() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+    with SessionLocal() as db:
+        contract = _contract(0, datetime(2026, 1, 1, tzinfo=timezone.utc))
+        contract.status = "pending_review"
+        contract.review_item = ReviewQueue(status="pending", reason="threshold")
+        db.add(contract)
+        db.commit()
+
+        assert approve_review(1, db=db) == {"status": "approved", "review_id": 1, "contract_id": 1}
+        with pytest.raises(HTTPException) as not_pending:
+            reject_review(1, db=db)
+        with pytest.raises(HTTPException) as missing:
+            approve_review(99, db=db)
+
+        db.expire_all()
+        review = db.get(ReviewQueue, 1)
+        assert review.status == "approved"
+        assert review.resolved_at is not None
+        assert db.get(ProcessedContract, 1).status == "approved"
+
+    assert not_pending.value.status_code == 400
+    assert missing.value.status_code == 404
@@ -1,9 +1,24 @@
+import pytest
+
 from app.core.schemas import ContractExtraction, ValidationResult
 from app.routing.router import route_contract
 
+_CONTRACT_DEFAULTS = {
+    "vendor_name": "Vendor",
+    "contract_start_date": "2026-01-01",
+    "contract_end_date": "2027-01-01",
+    "total_value": 1000.0,
+    "confidence_score": 0.9,
+}
+
+
+# Fixtures are already-normalized literals, so validation is skipped.
+def _contract(**overrides: object) -> ContractExtraction:
+    return ContractExtraction.model_construct(**{**_CONTRACT_DEFAULTS, **overrides})
+
 
 def _validation(*, requires_human_review: bool = False) -> ValidationResult:
-    return ValidationResult(
+    return ValidationResult.model_construct(
         policy_violations=["missing_required_fields:vendor_name"] if requires_human_review else [],
         risk_level="high" if requires_human_review else "low",
         requires_human_review=requires_human_review,
@@ -11,49 +26,20 @@ def _validation(*, requires_human_review: bool = False) -> ValidationResult:
     )
 
 
-def test_route_to_review_on_low_confidence() -> None:
-    contract = ContractExtraction(
-        vendor_name="Vendor",
-        contract_start_date="2026-01-01",
-        contract_end_date="2027-01-01",
-        total_value=1000.0,
-        confidence_score=0.7,
-    )
-    decision = route_contract(contract, _validation(), policy_threshold=500000.0)
-    assert decision.route == "review_queue"
-
-
-def test_route_to_review_on_threshold_exceedance() -> None:
-    contract = ContractExtraction(
-        vendor_name="Vendor",
-        contract_start_date="2026-01-01",
-        contract_end_date="2027-01-01",
-        total_value=2000.0,
-        confidence_score=0.9,
-    )
-    decision = route_contract(contract, _validation(), policy_threshold=1000.0)
-    assert decision.route == "review_queue"
-
-
-def test_route_to_auto_approve_when_rules_pass() -> None:
-    contract = ContractExtraction(
-        vendor_name="Vendor",
-        contract_start_date="2026-01-01",
-        contract_end_date="2027-01-01",
-        total_value=1000.0,
-        confidence_score=0.9,
-    )
-    decision = route_contract(contract, _validation(), policy_threshold=5000.0)
-    assert decision.route == "auto_approve"
+@pytest.mark.parametrize(
+    ("overrides", "policy_threshold", "expected_route"),
+    [
+        pytest.param({"confidence_score": 0.7}, 500000.0, "review_queue", id="low_confidence"),
+        pytest.param({"total_value": 2000.0}, 1000.0, "review_queue", id="threshold_exceedance"),
+        pytest.param({}, 5000.0, "auto_approve", id="rules_pass"),
+    ],
+)
+def test_route_contract_rules(overrides: dict, policy_threshold: float, expected_route: str) -> None:
+    decision = route_contract(_contract(**overrides), _validation(), policy_threshold=policy_threshold)
+    assert decision.route == expected_route
 
 
 def test_route_to_review_when_validation_requires_human_review() -> None:
-    contract = ContractExtraction(
-        vendor_name="Vendor",
-        contract_start_date="2026-01-01",
-        contract_end_date="2027-01-01",
-        total_value=1000.0,
-        confidence_score=0.95,
-    )
+    contract = _contract(confidence_score=0.95)
     decision = route_contract(contract, _validation(requires_human_review=True))
     assert decision.route == "review_queue"
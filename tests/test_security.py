@@ -1,57 +1,64 @@
+import hmac
+
 import pytest
 from fastapi import HTTPException
 from starlette.requests import Request
 
+from app.core import security
 from app.core.config import Settings
 from app.core.security import verify_admin_api_key
 
 
-def _request() -> Request:
-    return Request(
-        {
-            "type": "http",
-            "method": "GET",
-            "path": "/review-queue",
-            "headers": [],
-            "query_string": b"",
-            "client": ("127.0.0.1", 12345),
-            "scheme": "http",
-            "server": ("testserver", 80),
-        }
-    )
+# verify_admin_api_key only reads client/path for logging, so one request
+# object serves every test.
+_REQUEST = Request(
+    {
+        "type": "http",
+        "method": "GET",
+        "path": "/review-queue",
+        "headers": [],
+        "query_string": b"",
+        "client": ("127.0.0.1", 12345),
+        "scheme": "http",
+        "server": ("testserver", 80),
+    }
+)
+
+
+# Built once; tests only vary admin_api_key, applied with model_copy. Nothing
+# reads the base's cached properties, so copies never inherit stale values.
+_BASE_SETTINGS = Settings(
+    anthropic_api_key="test-anthropic",
+    database_url="sqlite:///./test.db",
+    webhook_secret="webhook-secret",
+    admin_api_key="",
+    allowed_origins_raw="http://localhost:3000",
+    extraction_model="claude-test",
+    validation_model="claude-test",
+    embedding_model="sentence-transformers/all-MiniLM-L6-v2",
+)
 
 
 def _settings(**overrides: object) -> Settings:
-    base = {
-        "anthropic_api_key": "test-anthropic",
-        "database_url": "sqlite:///./test.db",
-        "webhook_secret": "webhook-secret",
-        "admin_api_key": "",
-        "allowed_origins_raw": "http://localhost:3000",
-        "extraction_model": "claude-test",
-        "validation_model": "claude-test",
-        "embedding_model": "sentence-transformers/all-MiniLM-L6-v2",
-    }
-    base.update(overrides)
-    return Settings(**base)
+    return _BASE_SETTINGS.model_copy(update=overrides)
 
 
 def test_admin_api_key_missing_header_rejected() -> None:
     with pytest.raises(HTTPException) as exc:
-        verify_admin_api_key(request=_request(), x_api_key=None, settings=_settings(admin_api_key="admin"))
+        verify_admin_api_key(request=_REQUEST, x_api_key=None, settings=_settings(admin_api_key="admin"))
     assert exc.value.status_code == 401
 
 
 def test_admin_api_key_invalid_rejected() -> None:
     with pytest.raises(HTTPException) as exc:
-        verify_admin_api_key(request=_request(), x_api_key="wrong", settings=_settings(admin_api_key="admin"))
+        verify_admin_api_key(request=_REQUEST, x_api_key="wrong", settings=_settings(admin_api_key="admin"))
     assert exc.value.status_code == 401
 
 
 def test_admin_api_key_missing_configuration_returns_500() -> None:
     with pytest.raises(HTTPException) as exc:
         verify_admin_api_key(
-            request=_request(),
+            request=_REQUEST,
             x_api_key="webhook-secret",
             settings=_settings(admin_api_key=""),
         )
@@ -60,7 +67,25 @@ def test_admin_api_key_missing_configuration_returns_500() -> None:
 
 def test_admin_api_key_accepts_configured_secret_only() -> None:
     verify_admin_api_key(
-        request=_request(),
+        request=_REQUEST,
         x_api_key="admin-secret",
         settings=_settings(admin_api_key="admin-secret"),
     )
+
+
+def test_admin_api_key_is_compared_in_constant_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[bytes, bytes]] = []
+    compare_digest = hmac.compare_digest
+
+    def _spy(left: bytes, right: bytes) -> bool:
+        calls.append((left, right))
+        return compare_digest(left, right)
+
+    monkeypatch.setattr(security.hmac, "compare_digest", _spy)
+    long_key = "k" * 4096
+
+    with pytest.raises(HTTPException) as exc:
+        verify_admin_api_key(request=_REQUEST, x_api_key=long_key, settings=_settings(admin_api_key="admin"))
+
+    assert exc.value.status_code == 401
+    assert calls == [(long_key.encode("utf-8"), b"admin")]
@@ -1,5 +1,5 @@
 from app.agents.validation_agent import ValidationAgent
-from app.core.schemas import RetrievedPolicy
+from app.core.schemas import ContractExtraction, RetrievedPolicy
 
 
 def test_extract_policy_threshold_parses_usd_values() -> None:
@@ -16,3 +16,14 @@ def test_extract_policy_threshold_parses_usd_values() -> None:
 
     threshold = ValidationAgent._extract_policy_threshold(policies)
     assert threshold == 500000.0
+
+
+def test_missing_required_fields_preserves_field_order() -> None:
+    contract = ContractExtraction(
+        vendor_name="  ",
+        contract_start_date="2026-01-01",
+        contract_end_date="",
+        total_value=1000.0,
+        confidence_score=0.5,
+    )
+    assert ValidationAgent._missing_required_fields(contract) == ["vendor_name", "contract_end_date"]